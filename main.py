@@ -1,7 +1,25 @@
-import ccxt
+import ccxt.async_support as ccxt
 import asyncio
 import json
-from typing import Dict, Any
+import random
+from typing import Any, Awaitable, Callable, Dict
+
+
+async def with_backoff(coro_factory: Callable[[], Awaitable[Any]],
+                       retries: int = 6,
+                       base_delay: float = 0.1,
+                       max_delay: float = 10.0,
+                       rate: float = 2.0) -> Any:
+    """带指数退避+抖动的重试包装，避免固定间隔重试造成请求风暴"""
+    for attempt in range(retries):
+        try:
+            return await coro_factory()
+        except (ccxt.DDoSProtection, ccxt.RequestTimeout, ccxt.NetworkError) as e:
+            if attempt == retries - 1:
+                raise
+            delay = min(max_delay, base_delay * rate ** attempt) * random.uniform(0.5, 1.5)
+            print(f"⚠️  网络请求失败({type(e).__name__})，{delay:.2f}秒后重试...")
+            await asyncio.sleep(delay)
 
 
 class BinanceSpotFuturesDemo:
@@ -23,20 +41,37 @@ class BinanceSpotFuturesDemo:
             'enableRateLimit': True,
         })
 
-    def print_market_info(self, exchange: ccxt.Exchange, exchange_name: str):
+        # 市场数据缓存（按交易所id），避免每个演示方法重复load_markets
+        self._markets_cache: Dict[str, Dict] = {}
+
+    async def get_markets(self, exchange: ccxt.Exchange) -> Dict:
+        """获取（并缓存）交易所市场数据"""
+        if exchange.id not in self._markets_cache:
+            self._markets_cache[exchange.id] = await exchange.load_markets(reload=False)
+        return self._markets_cache[exchange.id]
+
+    async def print_market_info(self, exchange: ccxt.Exchange, exchange_name: str):
         """打印市场信息"""
         try:
             print(f"\n=== {exchange_name} 市场信息 ===")
 
             # 获取交易所信息
-            markets = exchange.load_markets()
+            markets = await self.get_markets(exchange)
             print(f"总交易对数量: {len(markets)}")
 
             # 获取一些热门交易对
-            popular_pairs = ['BTC/USDT', 'ETH/USDT', 'BNB/USDT']
+            popular_pairs = [p for p in ['BTC/USDT', 'ETH/USDT', 'BNB/USDT'] if p in markets]
+
+            # 优先使用批量接口，一次请求获取全部行情
+            if exchange.has.get('fetchTickers'):
+                tickers = await with_backoff(lambda: exchange.fetch_tickers(popular_pairs))
+            else:
+                tickers = {pair: await with_backoff(lambda p=pair: exchange.fetch_ticker(p))
+                           for pair in popular_pairs}
+
             for pair in popular_pairs:
-                if pair in markets:
-                    ticker = exchange.fetch_ticker(pair)
+                ticker = tickers.get(pair)
+                if ticker:
                     print(f"{pair}:")
                     print(f"  最新价格: ${ticker['last']:,.2f}")
                     print(f"  24小时变化: {ticker['percentage']:.2f}%")
@@ -44,14 +79,14 @@ class BinanceSpotFuturesDemo:
         except Exception as e:
             print(f"获取{exchange_name}市场信息时出错: {e}")
 
-    def demo_spot_trading(self):
+    async def demo_spot_trading(self):
         """演示现货交易功能"""
         try:
             print(f"\n=== 现货交易演示 ===")
 
             # 获取账户余额
             if self.spot.apiKey and self.spot.secret:
-                balance = self.spot.fetch_balance()
+                balance = await with_backoff(self.spot.fetch_balance)
                 print("账户余额:")
                 for currency, amount in balance['total'].items():
                     if amount > 0:
@@ -60,7 +95,7 @@ class BinanceSpotFuturesDemo:
                 print("未配置API密钥，跳过账户余额查询")
 
             # 获取订单簿
-            orderbook = self.spot.fetch_order_book('BTC/USDT', limit=5)
+            orderbook = await with_backoff(lambda: self.spot.fetch_order_book('BTC/USDT', limit=5))
             print(f"\nBTC/USDT 订单簿 (前5档):")
             print("买盘:")
             for bid in orderbook['bids']:
@@ -72,14 +107,14 @@ class BinanceSpotFuturesDemo:
         except Exception as e:
             print(f"现货交易演示出错: {e}")
 
-    def demo_futures_trading(self):
+    async def demo_futures_trading(self):
         """演示期货交易功能"""
         try:
             print(f"\n=== 期货交易演示 ===")
 
             # 获取期货账户余额
             if self.futures.apiKey and self.futures.secret:
-                balance = self.futures.fetch_balance()
+                balance = await with_backoff(self.futures.fetch_balance)
                 print("期货账户余额:")
                 for currency, amount in balance['total'].items():
                     if amount > 0:
@@ -88,12 +123,12 @@ class BinanceSpotFuturesDemo:
                 print("未配置API密钥，跳过期货账户余额查询")
 
             # 获取永续合约市场信息
-            contracts = self.futures.load_markets()
+            contracts = await self.get_markets(self.futures)
             btc_contract = 'BTC/USDT'
 
             if btc_contract in contracts:
                 # 获取合约信息
-                ticker = self.futures.fetch_ticker(btc_contract)
+                ticker = await with_backoff(lambda: self.futures.fetch_ticker(btc_contract))
                 print(f"\nBTC永续合约信息:")
                 print(f"  标记价格: ${ticker['markPrice']:,.2f}")
                 print(f"  最新价格: ${ticker['last']:,.2f}")
@@ -101,7 +136,7 @@ class BinanceSpotFuturesDemo:
                 print(f"  24小时成交量: {ticker['baseVolume']:,.2f}")
 
                 # 获取资金费率
-                funding_rate = self.futures.fetch_funding_rate(btc_contract)
+                funding_rate = await with_backoff(lambda: self.futures.fetch_funding_rate(btc_contract))
                 if funding_rate:
                     print(f"  资金费率: {funding_rate['fundingRate'] * 100:.4f}%")
                     print(f"  下次资金时间: {funding_rate['fundingTimestamp']}")
@@ -109,32 +144,54 @@ class BinanceSpotFuturesDemo:
         except Exception as e:
             print(f"期货交易演示出错: {e}")
 
-    def demo_websocket_streams(self):
-        """演示WebSocket数据流（需要ccxt.pro）"""
+    async def demo_websocket_streams(self, updates: int = 5):
+        """演示WebSocket数据流（基于ccxt.pro推送，替代REST轮询）"""
         print(f"\n=== WebSocket数据流演示 ===")
-        print("要使用WebSocket功能，需要安装ccxt.pro库")
-        print("运行命令: uv add ccxt.pro")
-        print("\nWebSocket功能包括:")
-        print("- 实时价格订阅")
-        print("- 实时订单簿更新")
-        print("- 实时成交数据")
-        print("- 实时账户更新")
-
-    def run_demo(self):
+
+        try:
+            import ccxt.pro as ccxtpro
+        except ImportError:
+            print("要使用WebSocket功能，需要安装ccxt.pro库")
+            print("运行命令: uv add ccxt.pro")
+            return
+
+        exchange = ccxtpro.binance()
+        symbol = 'BTC/USDT'
+
+        try:
+            # 服务端推送驱动：无轮询间隔，无每次请求的往返延迟
+            for _ in range(updates):
+                ticker, orderbook = await asyncio.gather(
+                    exchange.watch_ticker(symbol),
+                    exchange.watch_order_book(symbol, limit=5),
+                )
+                print(f"{symbol} 最新价: ${ticker['last']:,.2f} | "
+                      f"买一: ${orderbook['bids'][0][0]:,.2f} | "
+                      f"卖一: ${orderbook['asks'][0][0]:,.2f}")
+        except Exception as e:
+            print(f"WebSocket数据流演示出错: {e}")
+        finally:
+            await exchange.close()
+
+    async def run_demo(self):
         """运行完整演示"""
         print("=== 币安现货和期货交易演示 ===")
         print("注意: 当前使用测试环境 (sandbox=True)")
 
-        # 市场信息
-        self.print_market_info(self.spot, "币安现货")
-        self.print_market_info(self.futures, "币安期货")
-
-        # 交易演示
-        self.demo_spot_trading()
-        self.demo_futures_trading()
-
-        # WebSocket演示
-        self.demo_websocket_streams()
+        try:
+            # 市场信息和交易演示并发执行（相互独立的网络请求）
+            await asyncio.gather(
+                self.print_market_info(self.spot, "币安现货"),
+                self.print_market_info(self.futures, "币安期货"),
+                self.demo_spot_trading(),
+                self.demo_futures_trading(),
+            )
+
+            # WebSocket演示
+            await self.demo_websocket_streams()
+        finally:
+            await self.spot.close()
+            await self.futures.close()
 
         print(f"\n=== 演示完成 ===")
         print("配置说明:")
@@ -147,7 +204,7 @@ class BinanceSpotFuturesDemo:
 def main():
     """主函数"""
     demo = BinanceSpotFuturesDemo()
-    demo.run_demo()
+    asyncio.run(demo.run_demo())
 
 
 if __name__ == "__main__":
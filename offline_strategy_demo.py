@@ -4,21 +4,157 @@
 完全基于模拟数据，无需网络连接
 """
 
+import contextlib
+import functools
+import io
 import json
+import multiprocessing
+import sys
 import time
-import random
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
 
+try:
+    import orjson
+except ImportError:  # orjson为可选加速依赖
+    orjson = None
+
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck为可选加速依赖
+    bn = None
+
+# 预编译的美元格式化器：格式串只解析一次，热路径直接调用
+USD_FMT = "${:,.2f}".format
+
+try:
+    from numba import njit
+except ImportError:  # numba为可选加速依赖
+    njit = None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config(config_path: str) -> Dict:
+    """读取并解析配置文件（按路径缓存，参数扫描批量建实例时跳过重复磁盘IO）"""
+    with open(config_path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def moving_mean(values: np.ndarray, window: int) -> np.ndarray:
+    """滚动均值（等价于pandas rolling(window).mean()，但在纯NumPy/Bottleneck上计算）"""
+    if bn is not None:
+        return bn.move_mean(values, window=window, min_count=window)
+
+    # 累积和技巧：O(n)单遍计算，前window-1个位置为NaN
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        cumsum = np.cumsum(values)
+        out[window - 1] = cumsum[window - 1] / window
+        out[window:] = (cumsum[window:] - cumsum[:-window]) / window
+    return out
+
+
+def _indicators_kernel(open_price, close_price, volume, window,
+                       out_ma, out_ratio, out_pc):
+    """单遍融合计算volume_ma/volume_ratio/price_change_pct（运行和避免O(n·R)滚动）"""
+    n = len(volume)
+    running_sum = 0.0
+    for i in range(n):
+        running_sum += volume[i]
+        if i >= window:
+            running_sum -= volume[i - window]
+        if i >= window - 1:
+            ma = running_sum / window
+            out_ma[i] = ma
+            out_ratio[i] = volume[i] / ma if ma > 0 else np.nan
+        else:
+            out_ma[i] = np.nan
+            out_ratio[i] = np.nan
+        out_pc[i] = (close_price[i] - open_price[i]) / open_price[i] * 100.0
+
+
+if njit is not None:
+    _indicators_kernel = njit(cache=True)(_indicators_kernel)
+
+
+def _simulate_kernel(close, entry_mask, start, end, max_pos, account_balance,
+                     q_pct, u_pct, s_pct,
+                     entry_price, quantity, highest, stop_loss, invested):
+    """模拟主循环的纯数值内核（SoA数组上操作，可被Numba编译为原生代码）"""
+    n_active = 0
+    signal_count = 0
+    add_count = 0
+    exit_count = 0
+
+    for i in range(start, end):
+        price = close[i]
+
+        # 入场信号
+        if entry_mask[i]:
+            signal_count += 1
+            if n_active < max_pos:
+                size = account_balance * q_pct / 100.0 / price
+                entry_price[n_active] = price
+                quantity[n_active] = size
+                highest[n_active] = price
+                stop_loss[n_active] = price * (1.0 - s_pct / 100.0)
+                invested[n_active] = price * size
+                n_active += 1
+
+        old_count = n_active
+
+        # 更新最高价和止损价
+        for j in range(n_active):
+            if price > highest[j]:
+                highest[j] = price
+            stop_loss[j] = highest[j] * (1.0 - s_pct / 100.0)
+
+        # 加仓：先整体判定再执行，避免均价被本轮加仓污染
+        if n_active < max_pos:
+            for j in range(n_active):
+                if (price - entry_price[j]) / entry_price[j] * 100.0 >= u_pct:
+                    size = account_balance * q_pct / 100.0 / price
+                    total_quantity = quantity[j] + size
+                    total_cost = invested[j] + price * size
+                    quantity[j] = total_quantity
+                    entry_price[j] = total_cost / total_quantity
+                    invested[j] = total_cost
+
+        # 出场：原地压缩保留未触发止损的持仓
+        keep = 0
+        for j in range(n_active):
+            if (highest[j] - price) / highest[j] * 100.0 < s_pct:
+                if keep != j:
+                    entry_price[keep] = entry_price[j]
+                    quantity[keep] = quantity[j]
+                    highest[keep] = highest[j]
+                    stop_loss[keep] = stop_loss[j]
+                    invested[keep] = invested[j]
+                keep += 1
+        n_active = keep
+
+        if n_active > old_count:
+            add_count += 1
+        elif n_active < old_count:
+            exit_count += 1
+
+    return signal_count, add_count, exit_count, n_active
+
+
+if njit is not None:
+    _simulate_kernel = njit(cache=True)(_simulate_kernel)
+
 
 class OfflineVolumePriceBreakoutStrategy:
     """离线量价突破策略演示"""
 
-    def __init__(self, config_path: str = "strategy_config.json"):
+    def __init__(self, config_path: str = "strategy_config.json", verbose: bool = True):
         """初始化策略"""
         self.config = self._load_config(config_path)
+        self.verbose = verbose  # 是否打印逐K线的模拟过程
 
         # 策略参数
         self.R = self.config["parameters"]["R"]  # 平均成交量计算周期
@@ -28,12 +164,27 @@ class OfflineVolumePriceBreakoutStrategy:
         self.U = self.config["parameters"]["U"]  # 加仓涨幅百分比
         self.S = self.config["parameters"]["S"]  # 止盈止损百分比
 
+        # 预计算的常量比例，热路径免去每根K线的重复除法
+        self._q_frac = self.Q * 0.01
+        self._u_frac = self.U * 0.01
+        self._s_frac = self.S * 0.01
+        self._one_minus_s = 1 - self._s_frac
+
         # 交易参数
         self.symbol = self.config["trading"]["symbol"]
         self.timeframe = self.config["trading"]["timeframe"]
 
-        # 策略状态
-        self.positions: List[Dict] = []
+        # 策略状态 - 持仓采用SoA（结构数组）布局，便于向量化更新
+        self.max_positions = self.config["risk_management"]["max_positions"]
+        self.pos_entry_price = np.zeros(self.max_positions)
+        self.pos_quantity = np.zeros(self.max_positions)
+        self.pos_highest_price = np.zeros(self.max_positions)
+        self.pos_stop_loss_price = np.zeros(self.max_positions)
+        self.pos_total_invested = np.zeros(self.max_positions)
+        self.pos_entry_time = [None] * self.max_positions
+        self.n_positions = 0
+        # 单一PCG64随机数发生器（无全局状态锁，支持批量采样）
+        self._rng = np.random.default_rng(int(time.time()) % 1000)
         self.klines_data = pd.DataFrame()
         self.current_price = 103000.0  # 模拟初始价格
 
@@ -45,8 +196,7 @@ class OfflineVolumePriceBreakoutStrategy:
     def _load_config(self, config_path: str) -> Dict:
         """加载配置文件"""
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return _read_config(config_path)
         except Exception as e:
             print(f"⚠️  配置文件加载失败: {e}")
             return self._get_default_config()
@@ -64,58 +214,51 @@ class OfflineVolumePriceBreakoutStrategy:
         """生成更真实的K线数据"""
         print(f"🔧 生成 {count} 根真实感K线数据...")
 
-        # 设置随机种子确保可重现
-        np.random.seed(int(time.time()) % 1000)
-
-        # 生成时间序列
-        timestamps = pd.date_range(
-            start=datetime.now() - timedelta(minutes=count),
-            end=datetime.now(),
-            freq='1min'
-        )
+        # 使用实例级随机数发生器确保可重现
+        rng = self._rng
 
-        data = []
-        base_price = 103000
-        current_price = base_price
+        # 生成时间序列：datetime64分钟刻度的等差数组，免去DatetimeIndex逐点构造
+        start = np.datetime64(datetime.now(), 'm') - np.timedelta64(count, 'm')
+        timestamps = start + np.arange(count + 1, dtype='timedelta64[m]')
 
-        for i, timestamp in enumerate(timestamps):
-            # 模拟价格波动 - 带有趋势和周期性
-            base_volatility = 0.001  # 0.1%基础波动率
+        n = len(timestamps)
+        base_price = 103000.0
+        bar_idx = np.arange(n)
 
-            # 添加趋势因素
-            trend_factor = 0.0001 * np.sin(i / 50)  # 周期性趋势
+        # 模拟价格波动 - 趋势因素 + 随机冲击（全部一次性向量化生成）
+        trend_factor = 0.0001 * np.sin(bar_idx / 50)  # 周期性趋势
+        shock_std = np.where(bar_idx % 30 == 0, 0.005, 0.001)  # 每30分钟可能有大波动
+        shocks = rng.normal(0, 1, n) * shock_std
+        total_change = trend_factor + shocks
 
-            # 添加随机冲击
-            if i % 30 == 0:  # 每30分钟可能有大波动
-                shock = np.random.normal(0, 0.005)
-            else:
-                shock = np.random.normal(0, 0.001)
+        # 收盘价为逐根复利累乘，开盘价为上一根收盘价
+        close_price = base_price * np.cumprod(1 + total_change)
+        open_price = np.concatenate(([base_price], close_price[:-1]))
 
-            total_change = trend_factor + shock
+        # 生成高低价格
+        high_price = np.maximum(open_price, close_price) * (1 + np.abs(rng.normal(0, 0.0005, n)))
+        low_price = np.minimum(open_price, close_price) * (1 - np.abs(rng.normal(0, 0.0005, n)))
 
-            open_price = current_price
-            close_price = open_price * (1 + total_change)
+        # 模拟成交量 - 基于价格变动
+        base_volume = 1000
+        volatility_factor = np.abs(total_change) * 500  # 波动越大成交量越大
 
-            # 生成高低价格
-            high_price = max(open_price, close_price) * (1 + abs(np.random.normal(0, 0.0005)))
-            low_price = min(open_price, close_price) * (1 - abs(np.random.normal(0, 0.0005)))
+        # 偶尔产生成交量突破（15%概率产生大成交量）
+        breakout_mask = rng.random(n) < 0.15
+        volume_multiplier = np.where(breakout_mask, rng.uniform(3, 8, n), 1.0)
+        volume = base_volume * volume_multiplier * (1 + volatility_factor)
 
-            # 模拟成交量 - 基于价格变动
-            base_volume = 1000
-            volatility_factor = abs(total_change) * 500  # 波动越大成交量越大
+        # 预分配单块float64缓冲区，DataFrame直接包装ndarray无需逐列拷贝
+        ohlcv = np.empty((n, 5), dtype=np.float64)
+        ohlcv[:, 0] = open_price
+        ohlcv[:, 1] = high_price
+        ohlcv[:, 2] = low_price
+        ohlcv[:, 3] = close_price
+        ohlcv[:, 4] = volume
 
-            # 偶尔产生成交量突破
-            if random.random() < 0.15:  # 15%概率产生大成交量
-                volume_multiplier = random.uniform(3, 8)
-                volume = base_volume * volume_multiplier * (1 + volatility_factor)
-            else:
-                volume = base_volume * (1 + volatility_factor)
-
-            data.append([timestamp, open_price, high_price, low_price, close_price, volume])
-            current_price = close_price
-
-        df = pd.DataFrame(data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        df.set_index('timestamp', inplace=True)
+        df = pd.DataFrame(ohlcv, index=timestamps,
+                          columns=['open', 'high', 'low', 'close', 'volume'])
+        df.index.name = 'timestamp'
 
         # 计算技术指标
         df = self.calculate_indicators(df)
@@ -125,33 +268,58 @@ class OfflineVolumePriceBreakoutStrategy:
 
     def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
         """计算技术指标"""
-        # 计算滚动平均成交量
-        df['volume_ma'] = df['volume'].rolling(window=self.R).mean()
+        # 在原始NumPy数组上计算，避免pandas逐操作的对齐开销
+        volume = df['volume'].to_numpy()
+        open_price = df['open'].to_numpy()
+        close_price = df['close'].to_numpy()
+
+        if njit is not None:
+            # 融合内核：单遍扫描同时产出三个指标列，内存流量降为1/3
+            n = len(volume)
+            volume_ma = np.empty(n)
+            volume_ratio = np.empty(n)
+            price_change_pct = np.empty(n)
+            _indicators_kernel(open_price, close_price, volume, self.R,
+                               volume_ma, volume_ratio, price_change_pct)
+            df['volume_ma'] = volume_ma
+            df['volume_ratio'] = volume_ratio
+            df['price_change_pct'] = price_change_pct
+        else:
+            # 计算滚动平均成交量
+            volume_ma = moving_mean(volume, self.R)
+            df['volume_ma'] = volume_ma
 
-        # 计算成交量比
-        df['volume_ratio'] = df['volume'] / df['volume_ma']
+            # 计算成交量比
+            df['volume_ratio'] = volume / volume_ma
 
-        # 计算价格涨跌幅
-        df['price_change_pct'] = ((df['close'] - df['open']) / df['open'] * 100)
+            # 计算价格涨跌幅
+            df['price_change_pct'] = (close_price - open_price) / open_price * 100
 
         # 计算收盘价变化
-        df['close_change'] = df['close'].pct_change()
+        close_change = np.empty(len(close_price))
+        close_change[0] = np.nan
+        close_change[1:] = close_price[1:] / close_price[:-1] - 1
+        df['close_change'] = close_change
 
         return df
 
-    def check_entry_signal(self, kline: Dict) -> Optional[Dict]:
-        """检查入场信号"""
-        volume_breakout = kline['volume_ratio'] >= self.N
-        price_breakout = kline['price_change_pct'] >= self.M
+    def check_entry_signal(self, kline) -> Optional[Dict]:
+        """检查入场信号
+
+        接受 ``df.itertuples()`` 产出的轻量namedtuple行（属性访问，
+        无需iloc构造Series再to_dict）。
+        """
+        volume_breakout = kline.volume_ratio >= self.N
+        price_breakout = kline.price_change_pct >= self.M
 
         if volume_breakout and price_breakout:
             return {
                 'signal': 'ENTRY',
-                'price': kline['close'],
-                'volume': kline['volume'],
-                'volume_ratio': kline['volume_ratio'],
-                'price_change': kline['price_change_pct'],
-                'timestamp': kline.name
+                'price': kline.close,
+                'volume': kline.volume,
+                'volume_ratio': kline.volume_ratio,
+                'price_change_pct': kline.price_change_pct,
+                'timestamp': kline.Index
             }
 
         return None
@@ -160,157 +328,168 @@ class OfflineVolumePriceBreakoutStrategy:
         """计算仓位大小"""
         # 模拟账户余额
         account_balance = 10000  # 10000 USDT
-        invest_amount = account_balance * (self.Q / 100)
+        invest_amount = account_balance * self._q_frac
         position_size = invest_amount / self.current_price
         return position_size
 
     def execute_entry(self, signal: Dict):
         """执行入场"""
-        max_positions = self.config["risk_management"]["max_positions"]
-        if len(self.positions) >= max_positions:
-            print(f"⚠️  已达最大持仓数量 {max_positions}，跳过入场信号")
+        if self.n_positions >= self.max_positions:
+            print(f"⚠️  已达最大持仓数量 {self.max_positions}，跳过入场信号")
             return
 
         position_size = self.calculate_position_size()
 
-        position = {
-            'symbol': self.symbol,
-            'entry_price': signal['price'],
-            'quantity': position_size,
-            'entry_time': signal['timestamp'],
-            'highest_price': signal['price'],
-            'stop_loss_price': signal['price'] * (1 - self.S / 100),
-            'total_invested': signal['price'] * position_size
-        }
-
-        self.positions.append(position)
-
-        print("🚨" + "="*50)
-        print("🚨 入场信号执行成功！")
-        print(f"💰 入场价格: ${signal['price']:,.2f}")
-        print(f"📊 入场数量: {position_size:.6f} BTC")
-        print(f"📈 成交量比: {signal['volume_ratio']:.2f}x")
-        print(f"📊 价格变化: {signal['price_change_pct']:+.2f}%")
-        print(f"💼 当前持仓数: {len(self.positions)}")
-        print(f"📍 止损价格: ${position['stop_loss_price']:,.2f}")
-        print("🚨" + "="*50)
-
-    def check_add_position_signal(self, position: Dict, current_price: float) -> bool:
-        """检查加仓信号"""
-        price_increase_pct = ((current_price - position['entry_price']) /
-                             position['entry_price'] * 100)
+        # 写入SoA数组的下一个空槽位
+        i = self.n_positions
+        self.pos_entry_price[i] = signal['price']
+        self.pos_quantity[i] = position_size
+        self.pos_highest_price[i] = signal['price']
+        self.pos_stop_loss_price[i] = signal['price'] * self._one_minus_s
+        self.pos_total_invested[i] = signal['price'] * position_size
+        self.pos_entry_time[i] = signal['timestamp']
+        self.n_positions += 1
+
+        # 整段拼好后单次write，避免逐行print的stdout锁与刷新开销
+        sys.stdout.write(
+            "🚨" + "="*50 + "\n"
+            "🚨 入场信号执行成功！\n"
+            f"💰 入场价格: {USD_FMT(signal['price'])}\n"
+            f"📊 入场数量: {position_size:.6f} BTC\n"
+            f"📈 成交量比: {signal['volume_ratio']:.2f}x\n"
+            f"📊 价格变化: {signal['price_change_pct']:+.2f}%\n"
+            f"💼 当前持仓数: {self.n_positions}\n"
+            f"📍 止损价格: {USD_FMT(self.pos_stop_loss_price[i])}\n"
+            + "🚨" + "="*50 + "\n")
+
+    def check_add_position_signal(self, entry_price: np.ndarray, current_price: float) -> np.ndarray:
+        """检查加仓信号（向量化，返回布尔掩码）"""
+        price_increase_pct = (current_price - entry_price) / entry_price * 100
         return price_increase_pct >= self.U
 
-    def check_exit_signal(self, position: Dict, current_price: float) -> bool:
-        """检查出场信号"""
-        drawdown_pct = ((position['highest_price'] - current_price) /
-                       position['highest_price'] * 100)
+    def check_exit_signal(self, highest_price: np.ndarray, current_price: float) -> np.ndarray:
+        """检查出场信号（向量化，返回布尔掩码）"""
+        drawdown_pct = (highest_price - current_price) / highest_price * 100
         return drawdown_pct >= self.S
 
     def update_positions(self, current_price: float):
         """更新持仓状态"""
-        positions_to_remove = []
-
-        for position in self.positions:
-            # 更新最高价和止损价
-            if current_price > position['highest_price']:
-                position['highest_price'] = current_price
-                position['stop_loss_price'] = position['highest_price'] * (1 - self.S / 100)
-
-            # 检查加仓信号
-            if self.check_add_position_signal(position, current_price):
-                self.execute_add_position(position)
-
-            # 检查出场信号
-            if self.check_exit_signal(position, current_price):
-                self.execute_exit(position)
-                positions_to_remove.append(position)
-
-        # 移除已平仓的持仓
-        for position in positions_to_remove:
-            if position in self.positions:
-                self.positions.remove(position)
+        n = self.n_positions
+        if n == 0:
+            return
 
-    def execute_add_position(self, position: Dict):
+        # 向量化更新最高价和止损价
+        highest = self.pos_highest_price[:n]
+        np.maximum(highest, current_price, out=highest)
+        self.pos_stop_loss_price[:n] = highest * self._one_minus_s
+
+        # 检查加仓信号
+        add_mask = self.check_add_position_signal(self.pos_entry_price[:n], current_price)
+        for i in np.flatnonzero(add_mask):
+            self.execute_add_position(int(i))
+
+        # 检查出场信号并压缩数组，移除已平仓的持仓
+        exit_mask = self.check_exit_signal(self.pos_highest_price[:n], current_price)
+        if exit_mask.any():
+            for i in np.flatnonzero(exit_mask):
+                self.execute_exit(int(i))
+
+            keep = np.flatnonzero(~exit_mask)
+            n_keep = len(keep)
+            self.pos_entry_price[:n_keep] = self.pos_entry_price[keep]
+            self.pos_quantity[:n_keep] = self.pos_quantity[keep]
+            self.pos_highest_price[:n_keep] = self.pos_highest_price[keep]
+            self.pos_stop_loss_price[:n_keep] = self.pos_stop_loss_price[keep]
+            self.pos_total_invested[:n_keep] = self.pos_total_invested[keep]
+            self.pos_entry_time[:n_keep] = [self.pos_entry_time[int(i)] for i in keep]
+            self.n_positions = n_keep
+
+    def execute_add_position(self, index: int):
         """执行加仓"""
-        max_positions = self.config["risk_management"]["max_positions"]
-        if len(self.positions) >= max_positions:
+        if self.n_positions >= self.max_positions:
             return
 
         additional_size = self.calculate_position_size()
         additional_cost = self.current_price * additional_size
 
         # 更新持仓信息
-        total_quantity = position['quantity'] + additional_size
-        total_cost = position['total_invested'] + additional_cost
-
-        position['quantity'] = total_quantity
-        position['entry_price'] = total_cost / total_quantity
-        position['total_invested'] = total_cost
-
-        print("📈" + "="*40)
-        print("📈 加仓信号执行成功！")
-        print(f"💰 加仓价格: ${self.current_price:,.2f}")
-        print(f"📊 加仓数量: {additional_size:.6f} BTC")
-        print(f"💼 新持仓均价: ${position['entry_price']:,.2f}")
-        print(f"📈 总数量: {position['quantity']:.6f} BTC")
-        print("📈" + "="*40)
-
-    def execute_exit(self, position: Dict):
+        total_quantity = self.pos_quantity[index] + additional_size
+        total_cost = self.pos_total_invested[index] + additional_cost
+
+        self.pos_quantity[index] = total_quantity
+        self.pos_entry_price[index] = total_cost / total_quantity
+        self.pos_total_invested[index] = total_cost
+
+        sys.stdout.write(
+            "📈" + "="*40 + "\n"
+            "📈 加仓信号执行成功！\n"
+            f"💰 加仓价格: {USD_FMT(self.current_price)}\n"
+            f"📊 加仓数量: {additional_size:.6f} BTC\n"
+            f"💼 新持仓均价: {USD_FMT(self.pos_entry_price[index])}\n"
+            f"📈 总数量: {self.pos_quantity[index]:.6f} BTC\n"
+            + "📈" + "="*40 + "\n")
+
+    def execute_exit(self, index: int):
         """执行出场"""
         exit_price = self.current_price
-        pnl = (exit_price - position['entry_price']) * position['quantity']
-        pnl_pct = ((exit_price - position['entry_price']) / position['entry_price'] * 100)
-
-        print("🔴" + "="*50)
-        print("🔴 出场信号执行成功！")
-        print(f"💰 出场价格: ${exit_price:,.2f}")
-        print(f"📊 入场价格: ${position['entry_price']:,.2f}")
-        print(f"💼 持仓数量: {position['quantity']:.6f} BTC")
-        print(f"📈 最高价格: ${position['highest_price']:,.2f}")
-        print(f"💵 盈亏金额: ${pnl:+.2f}")
-        print(f"📊 盈亏比例: {pnl_pct:+.2f}%")
-        print("🔴" + "="*50)
+        entry_price = self.pos_entry_price[index]
+        pnl = (exit_price - entry_price) * self.pos_quantity[index]
+        pnl_pct = (exit_price - entry_price) / entry_price * 100
+
+        sys.stdout.write(
+            "🔴" + "="*50 + "\n"
+            "🔴 出场信号执行成功！\n"
+            f"💰 出场价格: {USD_FMT(exit_price)}\n"
+            f"📊 入场价格: {USD_FMT(entry_price)}\n"
+            f"💼 持仓数量: {self.pos_quantity[index]:.6f} BTC\n"
+            f"📈 最高价格: {USD_FMT(self.pos_highest_price[index])}\n"
+            f"💵 盈亏金额: ${pnl:+.2f}\n"
+            f"📊 盈亏比例: {pnl_pct:+.2f}%\n"
+            + "🔴" + "="*50 + "\n")
 
     def print_status(self):
-        """打印当前状态"""
-        print("\n" + "="*60)
-        print("📊 策略状态报告")
-        print("="*60)
-
-        print(f"💰 当前价格: ${self.current_price:,.2f}")
-        print(f"📈 持仓数量: {len(self.positions)}")
-
-        if self.positions:
-            total_pnl = 0
-            total_invested = 0
-
-            print(f"\n📈 持仓详情:")
-            for i, pos in enumerate(self.positions, 1):
-                current_pnl = (self.current_price - pos['entry_price']) * pos['quantity']
-                pnl_pct = ((self.current_price - pos['entry_price']) / pos['entry_price'] * 100)
-
-                total_pnl += current_pnl
-                total_invested += pos['total_invested']
-
-                print(f"  持仓 {i}:")
-                print(f"    💰 入场价: ${pos['entry_price']:,.2f}")
-                print(f"    📍 当前价: ${self.current_price:,.2f}")
-                print(f"    📊 数量: {pos['quantity']:.6f}")
-                print(f"    ⬆️  最高价: ${pos['highest_price']:,.2f}")
-                print(f"    🛑 止损价: ${pos['stop_loss_price']:,.2f}")
-                print(f"    💵 盈亏: ${current_pnl:+.2f} ({pnl_pct:+.2f}%)")
+        """打印当前状态（整段缓冲，单次write输出）"""
+        lines = []
+        ap = lines.append
+        ap("\n" + "="*60)
+        ap("📊 策略状态报告")
+        ap("="*60)
+
+        n = self.n_positions
+        ap(f"💰 当前价格: {USD_FMT(self.current_price)}")
+        ap(f"📈 持仓数量: {n}")
+
+        if n > 0:
+            # 向量化计算各持仓盈亏
+            entry = self.pos_entry_price[:n]
+            qty = self.pos_quantity[:n]
+            pnl_arr = (self.current_price - entry) * qty
+            pnl_pct_arr = (self.current_price - entry) / entry * 100
+
+            total_pnl = float(pnl_arr.sum())
+            total_invested = float(self.pos_total_invested[:n].sum())
+
+            ap(f"\n📈 持仓详情:")
+            for i in range(n):
+                ap(f"  持仓 {i + 1}:")
+                ap(f"    💰 入场价: {USD_FMT(entry[i])}")
+                ap(f"    📍 当前价: {USD_FMT(self.current_price)}")
+                ap(f"    📊 数量: {qty[i]:.6f}")
+                ap(f"    ⬆️  最高价: {USD_FMT(self.pos_highest_price[i])}")
+                ap(f"    🛑 止损价: {USD_FMT(self.pos_stop_loss_price[i])}")
+                ap(f"    💵 盈亏: ${pnl_arr[i]:+.2f} ({pnl_pct_arr[i]:+.2f}%)")
 
             total_pnl_pct = (total_pnl / total_invested * 100) if total_invested > 0 else 0
-            print(f"\n💰 总盈亏: ${total_pnl:+.2f} ({total_pnl_pct:+.2f}%)")
-            print(f"💼 总投入: ${total_invested:,.2f}")
+            ap(f"\n💰 总盈亏: ${total_pnl:+.2f} ({total_pnl_pct:+.2f}%)")
+            ap(f"💼 总投入: {USD_FMT(total_invested)}")
         else:
-            print("\n💼 当前无持仓")
+            ap("\n💼 当前无持仓")
 
-        print("="*60)
+        ap("="*60)
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    def run_simulation(self, duration_minutes: int = 50):
-        """运行模拟"""
+    def run_simulation(self, duration_minutes: int = 50) -> Dict:
+        """运行模拟，返回交易统计"""
         print(f"\n🎯 开始离线量价突破策略模拟...")
         print(f"⏰ 模拟时长: {duration_minutes} 分钟")
         print("="*60)
@@ -326,36 +505,68 @@ class OfflineVolumePriceBreakoutStrategy:
         add_position_count = 0
         exit_count = 0
 
-        for i in range(start_idx, end_idx):
-            kline = self.klines_data.iloc[i]
-            self.current_price = float(kline['close'])
+        # 一次性提取NumPy列并向量化计算入场信号，避免逐行iloc/to_dict开销
+        close_arr = self.klines_data['close'].to_numpy()
+        volume_arr = self.klines_data['volume'].to_numpy()
+        volume_ratio_arr = self.klines_data['volume_ratio'].to_numpy()
+        price_change_arr = self.klines_data['price_change_pct'].to_numpy()
+        timestamps = self.klines_data.index
+        entry_mask = (volume_ratio_arr >= self.N) & (price_change_arr >= self.M)
+
+        if not self.verbose:
+            # 快速路径：JIT编译的数值内核（跳过逐笔交易横幅输出）
+            signal_count, add_position_count, exit_count, self.n_positions = _simulate_kernel(
+                close_arr, entry_mask, start_idx, end_idx, self.max_positions,
+                10000.0, float(self.Q), float(self.U), float(self.S),
+                self.pos_entry_price, self.pos_quantity, self.pos_highest_price,
+                self.pos_stop_loss_price, self.pos_total_invested)
+            self.current_price = float(close_arr[end_idx - 1])
+
+            print(f"\n🏁 模拟完成!")
+            print(f"📊 交易统计:")
+            print(f"  🚨 入场信号: {signal_count} 次")
+            print(f"  📈 加仓操作: {add_position_count} 次")
+            print(f"  🔴 出场操作: {exit_count} 次")
+            self.print_status()
+            return self._simulation_stats(signal_count, add_position_count, exit_count)
 
-            print(f"\n⏰ 时间: {kline.name.strftime('%H:%M:%S')}")
-            print(f"💰 价格: ${self.current_price:,.2f} ({kline['price_change_pct']:+.2f}%)")
-            print(f"📊 成交量: {kline['volume']:,.0f} (比: {kline['volume_ratio']:.2f})")
-
-            # 检查入场信号
-            signal = self.check_entry_signal(kline.to_dict())
-            if signal:
+        for i in range(start_idx, end_idx):
+            self.current_price = float(close_arr[i])
+
+            if self.verbose:
+                # 单次write输出整段状态，减少stdout刷新开销
+                print(f"\n⏰ 时间: {timestamps[i].strftime('%H:%M:%S')}\n"
+                      f"💰 价格: ${self.current_price:.2f} ({price_change_arr[i]:+.2f}%)\n"
+                      f"📊 成交量: {volume_arr[i]:.0f} (比: {volume_ratio_arr[i]:.2f})")
+
+            # 检查入场信号（向量化预计算的掩码）
+            signal = None
+            if entry_mask[i]:
+                signal = {
+                    'signal': 'ENTRY',
+                    'price': self.current_price,
+                    'volume': volume_arr[i],
+                    'volume_ratio': volume_ratio_arr[i],
+                    'price_change_pct': price_change_arr[i],
+                    'timestamp': timestamps[i],
+                }
                 signal_count += 1
                 self.execute_entry(signal)
 
             # 更新现有持仓
-            old_positions_count = len(self.positions)
+            old_positions_count = self.n_positions
             self.update_positions(self.current_price)
 
             # 统计操作
-            if len(self.positions) > old_positions_count:
+            if self.n_positions > old_positions_count:
                 add_position_count += 1
-            elif len(self.positions) < old_positions_count:
+            elif self.n_positions < old_positions_count:
                 exit_count += 1
 
             # 每10分钟或有交易时打印状态
-            if (i - start_idx) % 10 == 0 or signal:
+            if self.verbose and ((i - start_idx) % 10 == 0 or signal):
                 self.print_status()
 
-            time.sleep(0.1)  # 短暂延迟
-
         # 最终状态和统计
         print(f"\n🏁 模拟完成!")
         print(f"📊 交易统计:")
@@ -364,6 +575,47 @@ class OfflineVolumePriceBreakoutStrategy:
         print(f"  🔴 出场操作: {exit_count} 次")
 
         self.print_status()
+        return self._simulation_stats(signal_count, add_position_count, exit_count)
+
+    def _simulation_stats(self, signal_count: int, add_position_count: int,
+                          exit_count: int) -> Dict:
+        """汇总一次模拟的统计结果"""
+        n = self.n_positions
+        open_pnl = float(((self.current_price - self.pos_entry_price[:n])
+                          * self.pos_quantity[:n]).sum())
+        return {
+            'signal_count': signal_count,
+            'add_position_count': add_position_count,
+            'exit_count': exit_count,
+            'open_positions': n,
+            'open_pnl': open_pnl,
+            'final_price': self.current_price,
+        }
+
+
+def backtest(params: Dict, seed: int = 0, duration_minutes: int = 500,
+             config_path: str = "strategy_config.json") -> Dict:
+    """单组参数的回测（模块级纯函数，可被多进程worker pickle调用）"""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        strategy = OfflineVolumePriceBreakoutStrategy(config_path, verbose=False)
+        for key, value in params.items():
+            setattr(strategy, key, value)
+        # 覆盖参数后重建派生常量与随机种子，保证结果可复现
+        strategy._q_frac = strategy.Q * 0.01
+        strategy._u_frac = strategy.U * 0.01
+        strategy._s_frac = strategy.S * 0.01
+        strategy._one_minus_s = 1 - strategy._s_frac
+        strategy._rng = np.random.default_rng(seed)
+        stats = strategy.run_simulation(duration_minutes)
+    return {**params, **stats}
+
+
+def run_parameter_sweep(grid: List[Dict], seed: int = 0, duration_minutes: int = 500,
+                        processes: Optional[int] = None) -> List[Dict]:
+    """多进程并行扫描参数组合（各组合相互独立，接近线性加速）"""
+    with multiprocessing.Pool(processes) as pool:
+        return pool.starmap(backtest, [(params, seed, duration_minutes) for params in grid])
 
 
 def main():
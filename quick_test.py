@@ -6,19 +6,31 @@
 import ccxt
 import asyncio
 
+# 模块级共享交易所实例：复用底层requests.Session（TCP+TLS保持连接），
+# 避免每次调用重建连接各付一次握手开销
+_exchange = None
 
-def test_binance_spot():
-    """测试币安现货连接"""
-    print("🚀 测试币安现货连接...")
 
-    try:
+def get_exchange() -> ccxt.binance:
+    """获取共享的币安现货实例"""
+    global _exchange
+    if _exchange is None:
         # 不使用沙盒模式，直接连接主网获取公开数据
-        exchange = ccxt.binance({
+        _exchange = ccxt.binance({
             'enableRateLimit': True,
             'options': {
                 'defaultType': 'spot',  # 明确指定现货
             }
         })
+    return _exchange
+
+
+def test_binance_spot():
+    """测试币安现货连接"""
+    print("🚀 测试币安现货连接...")
+
+    try:
+        exchange = get_exchange()
 
         print("📊 获取交易所信息...")
         markets = exchange.load_markets()
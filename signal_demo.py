@@ -4,26 +4,255 @@
 """
 
 import json
+import sys
 import time
-import random
-from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 
-
-def create_strategy_with_custom_params(R=20, N=1.5, M=0.8, Q=10, U=1.5, S=2.0):
+from offline_strategy_demo import moving_mean
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba为可选加速依赖
+    njit = None
+    prange = range
+
+# 事件类型编码（内核输出的事件日志使用）
+EVENT_ENTRY = 0
+EVENT_ADD = 1
+EVENT_EXIT = 2
+
+
+def _entry_signal(volume_ratio, price_change_pct, n, m):
+    """入场判定：量比与涨幅同时突破阈值"""
+    return volume_ratio >= n and price_change_pct >= m
+
+
+def _add_signal(price, entry_price, u):
+    """加仓判定：较持仓均价涨幅达到U%"""
+    return (price - entry_price) / entry_price * 100.0 >= u
+
+
+def _exit_signal(price, highest, s):
+    """出场判定：自最高价回撤达到S%"""
+    return (highest - price) / highest * 100.0 >= s
+
+
+if njit is not None:
+    # 显式签名触发预先编译，调用时无类型分发开销；nogil便于多线程场景复用
+    _entry_signal = njit('b1(f8,f8,f8,f8)', cache=True, nogil=True)(_entry_signal)
+    _add_signal = njit('b1(f8,f8,f8)', cache=True, nogil=True)(_add_signal)
+    _exit_signal = njit('b1(f8,f8,f8)', cache=True, nogil=True)(_exit_signal)
+
+
+def _backtest_kernel(close, volume_ratio, price_change_pct, start_idx,
+                     entry_threshold_n, entry_threshold_m, add_pct_u, stop_pct_s,
+                     entry_size, add_size, max_pos, events):
+    """逐K线回测的纯数值内核（SoA持仓数组，事件写入预分配缓冲区）
+
+    events每行: [bar索引, 事件类型, 价格, 盈亏]；返回(事件数, 剩余持仓数)。
+    """
+    entry_price = np.zeros(max_pos)
+    quantity = np.zeros(max_pos)
+    highest = np.zeros(max_pos)
+    invested = np.zeros(max_pos)
+    n_pos = 0
+    n_events = 0
+
+    for i in range(start_idx, len(close)):
+        price = close[i]
+
+        # 入场：量价双突破（融合为单一判断）。
+        # 交易本身不受事件缓冲容量影响，缓冲满时只丢弃日志记录
+        # （与下方出场分支一致），避免日志容量悄悄改变回测结果
+        if (volume_ratio[i] >= entry_threshold_n
+                and price_change_pct[i] >= entry_threshold_m
+                and n_pos < max_pos):
+            entry_price[n_pos] = price
+            quantity[n_pos] = entry_size
+            highest[n_pos] = price
+            invested[n_pos] = price * entry_size
+            n_pos += 1
+            if n_events < len(events):
+                events[n_events, 0] = i
+                events[n_events, 1] = EVENT_ENTRY
+                events[n_events, 2] = price
+                events[n_events, 3] = 0.0
+                n_events += 1
+
+        # 加仓（同样无条件成交，仅日志受容量保护）
+        for j in range(n_pos):
+            if (price - entry_price[j]) / entry_price[j] * 100.0 >= add_pct_u:
+                total_quantity = quantity[j] + add_size
+                total_cost = invested[j] + price * add_size
+                quantity[j] = total_quantity
+                entry_price[j] = total_cost / total_quantity
+                invested[j] = total_cost
+                if n_events < len(events):
+                    events[n_events, 0] = i
+                    events[n_events, 1] = EVENT_ADD
+                    events[n_events, 2] = price
+                    events[n_events, 3] = 0.0
+                    n_events += 1
+
+        # 最高价更新 + 移动止损出场（原地压缩）
+        keep = 0
+        for j in range(n_pos):
+            if price > highest[j]:
+                highest[j] = price
+            if (highest[j] - price) / highest[j] * 100.0 >= stop_pct_s:
+                if n_events < len(events):
+                    events[n_events, 0] = i
+                    events[n_events, 1] = EVENT_EXIT
+                    events[n_events, 2] = price
+                    events[n_events, 3] = (price - entry_price[j]) * quantity[j]
+                    n_events += 1
+            else:
+                if keep != j:
+                    entry_price[keep] = entry_price[j]
+                    quantity[keep] = quantity[j]
+                    highest[keep] = highest[j]
+                    invested[keep] = invested[j]
+                keep += 1
+        n_pos = keep
+
+    return n_events, n_pos
+
+
+def _backtest_kernel_multi(close, volume_ratio, price_change_pct, start_idx,
+                           entry_threshold_n, entry_threshold_m, add_pct_u, stop_pct_s,
+                           entry_size, add_size, max_pos, events,
+                           n_events_out, n_pos_out):
+    """多标的并行回测：prange按标的切分，各自跑单标的内核（无共享写入）"""
+    for s in prange(close.shape[0]):
+        n_events_out[s], n_pos_out[s] = _backtest_kernel(
+            close[s], volume_ratio[s], price_change_pct[s], start_idx,
+            entry_threshold_n, entry_threshold_m, add_pct_u, stop_pct_s,
+            entry_size, add_size, max_pos, events[s])
+
+
+if njit is not None:
+    _backtest_kernel = njit(cache=True, nogil=True)(_backtest_kernel)
+    _backtest_kernel_multi = njit(cache=True, nogil=True, parallel=True)(_backtest_kernel_multi)
+
+
+def run_backtest(klines_data, R=20, N=1.5, M=0.8, U=1.5, S=2.0,
+                 entry_size=0.01, add_size=0.005, max_pos=64):
+    """在已生成的K线上做无输出快速回测，返回事件日志与统计"""
+    close = klines_data['close'].to_numpy()
+    volume_ratio = klines_data['volume_ratio'].to_numpy()
+    price_change_pct = klines_data['price_change_pct'].to_numpy()
+
+    # 事件缓冲按真实上界分配：每根K线至多1次入场 + max_pos次加仓
+    # + max_pos次出场，确保日志不会截断
+    events = np.zeros((len(close) * (2 * max_pos + 1), 4))
+    n_events, n_pos = _backtest_kernel(
+        close, volume_ratio, price_change_pct, R,
+        float(N), float(M), float(U), float(S),
+        entry_size, add_size, max_pos, events)
+
+    events = events[:n_events]
+    kinds = events[:, 1]
+    return {
+        'events': events,
+        'entry_count': int((kinds == EVENT_ENTRY).sum()),
+        'add_count': int((kinds == EVENT_ADD).sum()),
+        'exit_count': int((kinds == EVENT_EXIT).sum()),
+        'open_positions': n_pos,
+    }
+
+
+def find_exit_bar(close, entry_idx, stop_pct):
+    """已知全价格序列时，一次C级扫描求移动止损出场K线索引（找不到返回-1）
+
+    np.maximum.accumulate一次算出入场后的全部滚动最高价，
+    替代逐K线的Python最高价更新。
+    """
+    highest = np.maximum.accumulate(close[entry_idx:])
+    drawdown_pct = (highest - close[entry_idx:]) / highest * 100
+    offset = int(np.argmax(drawdown_pct >= stop_pct))
+    if drawdown_pct[offset] >= stop_pct:
+        return entry_idx + offset
+    return -1
+
+
+def find_add_bar(close, entry_idx, entry_price, add_pct):
+    """已知全价格序列时，求首次触发加仓阈值的K线索引（找不到返回-1）"""
+    increase_pct = (close[entry_idx:] / entry_price - 1) * 100
+    offset = int(np.argmax(increase_pct >= add_pct))
+    if increase_pct[offset] >= add_pct:
+        return entry_idx + offset
+    return -1
+
+
+def run_backtest_multi(klines_by_symbol, R=20, N=1.5, M=0.8, U=1.5, S=2.0,
+                       entry_size=0.01, add_size=0.005, max_pos=64):
+    """对多个标的并行回测（numba prange按物理核扩展），返回逐标的统计
+
+    klines_by_symbol: {symbol: DataFrame}，各DataFrame需含
+    close/volume_ratio/price_change_pct列且长度一致。
+    """
+    symbols = list(klines_by_symbol)
+    n_bars = len(next(iter(klines_by_symbol.values())))
+
+    close = np.empty((len(symbols), n_bars))
+    volume_ratio = np.empty_like(close)
+    price_change_pct = np.empty_like(close)
+    for s, symbol in enumerate(symbols):
+        df = klines_by_symbol[symbol]
+        close[s] = df['close'].to_numpy()
+        volume_ratio[s] = df['volume_ratio'].to_numpy()
+        price_change_pct[s] = df['price_change_pct'].to_numpy()
+
+    # 与run_backtest相同的真实上界，逐标的互不共享
+    events = np.zeros((len(symbols), n_bars * (2 * max_pos + 1), 4))
+    n_events = np.zeros(len(symbols), dtype=np.int64)
+    n_pos = np.zeros(len(symbols), dtype=np.int64)
+    _backtest_kernel_multi(close, volume_ratio, price_change_pct, R,
+                           float(N), float(M), float(U), float(S),
+                           entry_size, add_size, max_pos, events, n_events, n_pos)
+
+    results = {}
+    for s, symbol in enumerate(symbols):
+        ev = events[s, :n_events[s]]
+        kinds = ev[:, 1]
+        results[symbol] = {
+            'events': ev,
+            'entry_count': int((kinds == EVENT_ENTRY).sum()),
+            'add_count': int((kinds == EVENT_ADD).sum()),
+            'exit_count': int((kinds == EVENT_EXIT).sum()),
+            'open_positions': int(n_pos[s]),
+        }
+    return results
+
+
+def create_strategy_with_custom_params(R=20, N=1.5, M=0.8, Q=10, U=1.5, S=2.0, verbose=True):
     """创建自定义参数的策略"""
     class CustomStrategy:
         def __init__(self):
+            # 输出缓冲：交易事件先积累在列表里，每根K线flush一次stdout
+            self.verbose = verbose
+            self._buf = []
             self.R = R  # 降低R值
             self.N = N  # 降低N值
             self.M = M  # 降低M值
             self.Q = Q
             self.U = U  # 降低U值
             self.S = S  # 降低S值
+            # 止损系数只在这里除一次，热路径上不再重复 1 - S/100
+            self._stop_factor = 1.0 - S / 100.0
             self.symbol = "BTC/USDT"
-            self.positions = []
+            # 持仓采用SoA（结构数组）布局：并行NumPy数组 + 活跃数量计数
+            self._capacity = 8
+            self.pos_entry_price = np.zeros(self._capacity)
+            self.pos_quantity = np.zeros(self._capacity)
+            self.pos_highest_price = np.zeros(self._capacity)
+            self.pos_stop_loss_price = np.zeros(self._capacity)
+            self.pos_total_invested = np.zeros(self._capacity)
+            self.n_pos = 0
             self.current_price = 100000.0
+            # 单一PCG64生成器，批量采样替代逐次的legacy全局状态更新
+            self.rng = np.random.default_rng()
 
             print(f"🎯 自定义策略参数:")
             print(f"   R={R} (成交量平均周期)")
@@ -33,172 +262,212 @@ def create_strategy_with_custom_params(R=20, N=1.5, M=0.8, Q=10, U=1.5, S=2.0):
             print(f"   U={U}% (加仓涨幅)")
             print(f"   S={S}% (止盈止损)")
 
+        def _log(self, line):
+            """缓冲一行输出（verbose=False时直接丢弃，回测零I/O开销）"""
+            if self.verbose:
+                self._buf.append(line)
+
+        def flush_log(self):
+            """把本K线积累的输出一次性写到stdout（单次锁获取/flush）"""
+            if self._buf:
+                sys.stdout.write('\n'.join(self._buf) + '\n')
+                self._buf.clear()
+
         def generate_signal_klines(self, count=30):
             """生成包含信号的K线"""
             print(f"🔧 生成 {count} 根包含信号的K线...")
 
-            timestamps = pd.date_range(
-                start=datetime.now() - timedelta(minutes=count),
-                end=datetime.now(),
-                freq='1min'
-            )
-
-            data = []
-            current_price = 100000
-
-            for i, timestamp in enumerate(timestamps):
-                open_price = current_price
-
-                # 每10分钟制造一次信号
-                if i % 10 == 5:  # 在第5分钟制造信号
-                    # 价格大幅上涨
-                    price_increase = random.uniform(0.008, 0.015)  # 0.8%-1.5%
-                    close_price = open_price * (1 + price_increase)
-
-                    # 大成交量
-                    volume = 5000 * random.uniform(3, 6)  # 3-6倍基础成交量
-                else:
-                    # 正常波动
-                    price_change = np.random.normal(0, 0.002)  # 0.2%波动
-                    close_price = open_price * (1 + price_change)
-                    volume = 1000 * random.uniform(0.5, 1.5)  # 正常成交量
-
-                high_price = max(open_price, close_price) * (1 + abs(np.random.normal(0, 0.001)))
-                low_price = min(open_price, close_price) * (1 - abs(np.random.normal(0, 0.001)))
-
-                data.append([timestamp, open_price, high_price, low_price, close_price, volume])
-                current_price = close_price
-
-            df = pd.DataFrame(data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-            df.set_index('timestamp', inplace=True)
-
-            # 计算指标
-            df['volume_ma'] = df['volume'].rolling(window=self.R).mean()
-            df['volume_ratio'] = df['volume'] / df['volume_ma']
-            df['price_change_pct'] = ((df['close'] - df['open']) / df['open'] * 100)
+            # periods直接给定长度：只取一次当前时间，且不会因区间端点多出一根
+            now = pd.Timestamp.now().floor('min')
+            timestamps = pd.date_range(end=now, periods=count, freq='1min')
+
+            n = len(timestamps)
+            base_price = 100000.0
+            idx = np.arange(n)
+
+            # 每10分钟制造一次信号（第5分钟），其余为正常波动 - 全部向量化采样
+            signal_mask = idx % 10 == 5
+            signal_returns = self.rng.uniform(0.008, 0.015, n)  # 0.8%-1.5%大幅上涨
+            normal_returns = self.rng.normal(0, 0.002, n)  # 0.2%波动
+            returns = np.where(signal_mask, signal_returns, normal_returns)
+
+            # 收盘价逐根复利累乘，开盘价为上一根收盘价
+            close_price = base_price * np.cumprod(1 + returns)
+            open_price = np.concatenate(([base_price], close_price[:-1]))
+
+            high_price = np.maximum(open_price, close_price) * (1 + np.abs(self.rng.normal(0, 0.001, n)))
+            low_price = np.minimum(open_price, close_price) * (1 - np.abs(self.rng.normal(0, 0.001, n)))
+
+            # 信号K线放大成交量（3-6倍基础量），正常K线0.5-1.5倍
+            volume = np.where(signal_mask,
+                              5000 * self.rng.uniform(3, 6, n),
+                              1000 * self.rng.uniform(0.5, 1.5, n))
+
+            df = pd.DataFrame({
+                'open': open_price,
+                'high': high_price,
+                'low': low_price,
+                'close': close_price,
+                'volume': volume,
+            }, index=timestamps)
+            df.index.name = 'timestamp'
+
+            # 计算指标（O(n)滚动均值内核，不经过pandas rolling机制）
+            df['volume_ma'] = moving_mean(volume, self.R)
+            df['volume_ratio'] = volume / df['volume_ma'].to_numpy()
+            df['price_change_pct'] = (close_price - open_price) / open_price * 100
 
             return df
 
-        def check_entry_signal(self, kline, timestamp):
-            """检查入场信号"""
-            volume_breakout = kline['volume_ratio'] >= self.N
-            price_breakout = kline['price_change_pct'] >= self.M
-
-            if volume_breakout and price_breakout:
+        def check_entry_signal(self, close, volume, volume_ratio, price_change_pct, timestamp):
+            """检查入场信号（标量谓词走预编译内核，仅命中时构造dict）"""
+            if _entry_signal(float(volume_ratio), float(price_change_pct),
+                             float(self.N), float(self.M)):
                 return {
                     'signal': 'ENTRY',
-                    'price': kline['close'],
-                    'volume': kline['volume'],
-                    'volume_ratio': kline['volume_ratio'],
-                    'price_change': kline['price_change_pct'],
+                    'price': close,
+                    'volume': volume,
+                    'volume_ratio': volume_ratio,
+                    'price_change': price_change_pct,
                     'timestamp': timestamp
                 }
             return None
 
+        def _grow(self):
+            """持仓数组扩容（容量翻倍，保留已有数据）"""
+            self._capacity *= 2
+            for name in ('pos_entry_price', 'pos_quantity', 'pos_highest_price',
+                         'pos_stop_loss_price', 'pos_total_invested'):
+                old = getattr(self, name)
+                new = np.zeros(self._capacity)
+                new[:len(old)] = old
+                setattr(self, name, new)
+
         def execute_entry(self, signal):
             """执行入场"""
             position_size = 0.01  # 0.01 BTC
 
-            position = {
-                'symbol': self.symbol,
-                'entry_price': signal['price'],
-                'quantity': position_size,
-                'entry_time': signal['timestamp'],
-                'highest_price': signal['price'],
-                'stop_loss_price': signal['price'] * (1 - self.S / 100),
-                'total_invested': signal['price'] * position_size
-            }
-
-            self.positions.append(position)
-
-            print("\n🚨" + "="*60)
-            print("🚨【入场信号执行成功！】")
-            print(f"💰 入场价格: ${signal['price']:,.2f}")
-            print(f"📊 入场数量: {position_size:.6f} BTC")
-            print(f"📈 成交量比: {signal['volume_ratio']:.2f}x (阈值: {self.N}x)")
-            print(f"📊 价格变化: {signal['price_change']:+.2f}% (阈值: {self.M}%)")
-            print(f"📍 止损价格: ${position['stop_loss_price']:,.2f}")
-            print("🚨" + "="*60)
-
-        def check_add_position_signal(self, position, current_price):
-            """检查加仓信号"""
-            price_increase_pct = ((current_price - position['entry_price']) /
-                                 position['entry_price'] * 100)
-            return price_increase_pct >= self.U
-
-        def execute_add_position(self, position):
+            if self.n_pos == self._capacity:
+                self._grow()
+
+            i = self.n_pos
+            self.pos_entry_price[i] = signal['price']
+            self.pos_quantity[i] = position_size
+            self.pos_highest_price[i] = signal['price']
+            self.pos_stop_loss_price[i] = signal['price'] * self._stop_factor
+            self.pos_total_invested[i] = signal['price'] * position_size
+            self.n_pos += 1
+
+            self._log("\n🚨" + "="*60)
+            self._log("🚨【入场信号执行成功！】")
+            self._log(f"💰 入场价格: ${signal['price']:,.2f}")
+            self._log(f"📊 入场数量: {position_size:.6f} BTC")
+            self._log(f"📈 成交量比: {signal['volume_ratio']:.2f}x (阈值: {self.N}x)")
+            self._log(f"📊 价格变化: {signal['price_change']:+.2f}% (阈值: {self.M}%)")
+            self._log(f"📍 止损价格: ${self.pos_stop_loss_price[i]:,.2f}")
+            self._log("🚨" + "="*60)
+
+        def execute_add_position(self, index):
             """执行加仓"""
             additional_size = 0.005  # 0.005 BTC
             additional_cost = self.current_price * additional_size
 
-            total_quantity = position['quantity'] + additional_size
-            total_cost = position['total_invested'] + additional_cost
-
-            position['quantity'] = total_quantity
-            position['entry_price'] = total_cost / total_quantity
-            position['total_invested'] = total_cost
-
-            print("\n📈" + "="*50)
-            print("📈【加仓信号执行成功！】")
-            print(f"💰 加仓价格: ${self.current_price:,.2f}")
-            print(f"📊 加仓数量: {additional_size:.6f} BTC")
-            print(f"💼 新持仓均价: ${position['entry_price']:,.2f}")
-            print(f"📈 总数量: {position['quantity']:.6f} BTC")
-            print("📈" + "="*50)
-
-        def check_exit_signal(self, position, current_price):
-            """检查出场信号"""
-            # 更新最高价
-            if current_price > position['highest_price']:
-                position['highest_price'] = current_price
-                position['stop_loss_price'] = position['highest_price'] * (1 - self.S / 100)
-
-            drawdown_pct = ((position['highest_price'] - current_price) /
-                           position['highest_price'] * 100)
-            return drawdown_pct >= self.S
-
-        def execute_exit(self, position):
-            """执行出场"""
+            total_quantity = self.pos_quantity[index] + additional_size
+            total_cost = self.pos_total_invested[index] + additional_cost
+
+            self.pos_quantity[index] = total_quantity
+            self.pos_entry_price[index] = total_cost / total_quantity
+            self.pos_total_invested[index] = total_cost
+
+            self._log("\n📈" + "="*50)
+            self._log("📈【加仓信号执行成功！】")
+            self._log(f"💰 加仓价格: ${self.current_price:,.2f}")
+            self._log(f"📊 加仓数量: {additional_size:.6f} BTC")
+            self._log(f"💼 新持仓均价: ${self.pos_entry_price[index]:,.2f}")
+            self._log(f"📈 总数量: {self.pos_quantity[index]:.6f} BTC")
+            self._log("📈" + "="*50)
+
+        def execute_exit(self, index):
+            """执行出场（打印详情；数组压缩由update_all_positions负责）"""
             exit_price = self.current_price
-            pnl = (exit_price - position['entry_price']) * position['quantity']
-            pnl_pct = ((exit_price - position['entry_price']) / position['entry_price'] * 100)
-
-            print("\n🔴" + "="*60)
-            print("🔴【出场信号执行成功！】")
-            print(f"💰 出场价格: ${exit_price:,.2f}")
-            print(f"📊 入场价格: ${position['entry_price']:,.2f}")
-            print(f"💼 持仓数量: {position['quantity']:.6f} BTC")
-            print(f"⬆️  最高价格: ${position['highest_price']:,.2f}")
-            print(f"🛑 止损价格: ${position['stop_loss_price']:,.2f}")
-            print(f"💵 盈亏金额: ${pnl:+.2f}")
-            print(f"📊 盈亏比例: {pnl_pct:+.2f}%")
-            print("🔴" + "="*60)
-
-            self.positions.remove(position)
+            entry_price = self.pos_entry_price[index]
+            pnl = (exit_price - entry_price) * self.pos_quantity[index]
+            pnl_pct = ((exit_price - entry_price) / entry_price * 100)
+
+            self._log("\n🔴" + "="*60)
+            self._log("🔴【出场信号执行成功！】")
+            self._log(f"💰 出场价格: ${exit_price:,.2f}")
+            self._log(f"📊 入场价格: ${entry_price:,.2f}")
+            self._log(f"💼 持仓数量: {self.pos_quantity[index]:.6f} BTC")
+            self._log(f"⬆️  最高价格: ${self.pos_highest_price[index]:,.2f}")
+            self._log(f"🛑 止损价格: ${self.pos_stop_loss_price[index]:,.2f}")
+            self._log(f"💵 盈亏金额: ${pnl:+.2f}")
+            self._log(f"📊 盈亏比例: {pnl_pct:+.2f}%")
+            self._log("🔴" + "="*60)
+
+        def update_all_positions(self, current_price):
+            """向量化更新全部持仓：加仓判定、最高价/止损更新、止损出场与压缩"""
+            n = self.n_pos
+            if n == 0:
+                return
+
+            entry = self.pos_entry_price[:n]
+            highest = self.pos_highest_price[:n]
+
+            # 加仓信号（掩码先算后执行，避免均价被本轮加仓污染）
+            price_increase_pct = (current_price - entry) / entry * 100
+            for i in np.flatnonzero(price_increase_pct >= self.U):
+                self.execute_add_position(int(i))
+
+            # 更新最高价与止损价
+            np.maximum(highest, current_price, out=highest)
+            self.pos_stop_loss_price[:n] = highest * self._stop_factor
+
+            # 出场信号与布尔掩码压缩
+            drawdown_pct = (highest - current_price) / highest * 100
+            exit_mask = drawdown_pct >= self.S
+            if exit_mask.any():
+                for i in np.flatnonzero(exit_mask):
+                    self.execute_exit(int(i))
+
+                keep = ~exit_mask
+                n_keep = int(keep.sum())
+                for name in ('pos_entry_price', 'pos_quantity', 'pos_highest_price',
+                             'pos_stop_loss_price', 'pos_total_invested'):
+                    arr = getattr(self, name)
+                    arr[:n_keep] = arr[:n][keep]
+                self.n_pos = n_keep
 
         def print_positions_status(self):
             """打印持仓状态"""
-            if not self.positions:
+            n = self.n_pos
+            if n == 0:
                 return
 
-            print(f"\n📊【当前持仓状态】")
-            for i, pos in enumerate(self.positions, 1):
-                current_pnl = (self.current_price - pos['entry_price']) * pos['quantity']
-                pnl_pct = ((self.current_price - pos['entry_price']) / pos['entry_price'] * 100)
-
-                print(f"持仓 {i}:")
-                print(f"  入场价: ${pos['entry_price']:,.2f}")
-                print(f"  当前价: ${self.current_price:,.2f}")
-                print(f"  数量: {pos['quantity']:.6f} BTC")
-                print(f"  最高价: ${pos['highest_price']:,.2f}")
-                print(f"  止损价: ${pos['stop_loss_price']:,.2f}")
-                print(f"  盈亏: ${current_pnl:+.2f} ({pnl_pct:+.2f}%)")
+            # 向量化计算全部持仓盈亏
+            entry = self.pos_entry_price[:n]
+            qty = self.pos_quantity[:n]
+            pnl_arr = (self.current_price - entry) * qty
+            pnl_pct_arr = (self.current_price - entry) / entry * 100
+
+            self._log(f"\n📊【当前持仓状态】")
+            for i in range(n):
+                self._log(f"持仓 {i + 1}:")
+                self._log(f"  入场价: ${entry[i]:,.2f}")
+                self._log(f"  当前价: ${self.current_price:,.2f}")
+                self._log(f"  数量: {qty[i]:.6f} BTC")
+                self._log(f"  最高价: ${self.pos_highest_price[i]:,.2f}")
+                self._log(f"  止损价: ${self.pos_stop_loss_price[i]:,.2f}")
+                self._log(f"  盈亏: ${pnl_arr[i]:+.2f} ({pnl_pct_arr[i]:+.2f}%)")
 
     return CustomStrategy()
 
 
-def main():
-    """主函数"""
+def main(pace=0.0):
+    """主函数
+
+    pace: 每根K线之间的演示停顿秒数，0表示全速回放（回测/测试用）
+    """
     print("🎯 量价突破信号触发演示")
     print("="*60)
     print("💡 使用更低门槛参数，更容易触发信号")
@@ -220,53 +489,49 @@ def main():
     print(f"\n📈 开始模拟交易...")
     print("="*60)
 
-    signal_count = 0
-    for i, (timestamp, kline) in enumerate(klines_data.iterrows()):
-        if i < 20:  # 前20根用于计算指标
-            continue
+    # 一次性提取NumPy列，循环中按整数索引取标量（无逐行Series/dict构造）
+    close_a = klines_data['close'].to_numpy()
+    vol_a = klines_data['volume'].to_numpy()
+    vr_a = klines_data['volume_ratio'].to_numpy()
+    pcp_a = klines_data['price_change_pct'].to_numpy()
+    timestamps = klines_data.index
 
-        strategy.current_price = float(kline['close'])
+    signal_count = 0
+    for i in range(20, len(close_a)):  # 前20根用于计算指标
+        strategy.current_price = float(close_a[i])
 
-        print(f"\n⏰ {timestamp.strftime('%H:%M:%S')}")
-        print(f"💰 价格: ${strategy.current_price:,.2f} ({kline['price_change_pct']:+.2f}%)")
-        print(f"📊 成交量: {kline['volume']:,.0f} (比: {kline['volume_ratio']:.2f}x)")
+        strategy._log(f"\n⏰ {timestamps[i].strftime('%H:%M:%S')}")
+        strategy._log(f"💰 价格: ${strategy.current_price:,.2f} ({pcp_a[i]:+.2f}%)")
+        strategy._log(f"📊 成交量: {vol_a[i]:,.0f} (比: {vr_a[i]:.2f}x)")
 
         # 检查入场信号
-        signal = strategy.check_entry_signal(kline.to_dict(), timestamp)
+        signal = strategy.check_entry_signal(
+            strategy.current_price, vol_a[i], vr_a[i], pcp_a[i], timestamps[i])
         if signal:
             signal_count += 1
             strategy.execute_entry(signal)
 
-        # 更新持仓（检查加仓和出场）
-        positions_to_remove = []
-        for position in strategy.positions:
-            # 检查加仓
-            if strategy.check_add_position_signal(position, strategy.current_price):
-                strategy.execute_add_position(position)
-
-            # 检查出場
-            if strategy.check_exit_signal(position, strategy.current_price):
-                strategy.execute_exit(position)
-                positions_to_remove.append(position)
-
-        # 移除已平仓持仓
-        for pos in positions_to_remove:
-            if pos in strategy.positions:
-                strategy.positions.remove(pos)
+        # 更新持仓（加仓、出场与压缩一次完成）
+        strategy.update_all_positions(strategy.current_price)
 
         # 打印持仓状态
         if i % 5 == 0 or signal:
             strategy.print_positions_status()
 
-        time.sleep(0.2)  # 短暂延迟
+        # 每根K线一次性写出全部缓冲输出
+        strategy.flush_log()
+
+        if pace:
+            time.sleep(pace)  # 仅演示模式下放慢输出节奏
 
     # 最终统计
     print(f"\n🏁 模拟完成！")
     print(f"📊 总共触发了 {signal_count} 次入场信号")
-    print(f"📈 最终持仓数量: {len(strategy.positions)}")
+    print(f"📈 最终持仓数量: {strategy.n_pos}")
 
-    if strategy.positions:
+    if strategy.n_pos:
         strategy.print_positions_status()
+        strategy.flush_log()
     else:
         print("💼 所有持仓已平仓")
 
@@ -282,4 +547,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(pace=0.2)  # 命令行演示保留原有的阅读节奏
\ No newline at end of file
@@ -1,9 +1,15 @@
-import ccxt
+import ccxt.async_support as ccxt
+import aiohttp
 import asyncio
+import json
+import os
 import time
-import threading
+import numpy as np
 from typing import Dict, Any
 
+# 市场数据磁盘缓存目录（按交易所+日期缓存，进程重启免一次HTTP拉取）
+MARKETS_CACHE_DIR = '.markets_cache'
+
 
 class BinanceSimpleDemo:
     def __init__(self):
@@ -14,6 +20,9 @@ class BinanceSimpleDemo:
             'secret': '',  # 填入您的Secret密钥
             'sandbox': False,
             'enableRateLimit': True,
+            'options': {
+                'defaultType': 'spot',  # 明确指定现货，跳过类型探测
+            },
         })
 
         # 期货实例
@@ -26,14 +35,72 @@ class BinanceSimpleDemo:
 
         self.running = False
         self.symbol = 'BTC/USDT'
-
-    def get_market_overview(self):
+        self.session = None
+
+    async def open_session(self):
+        """创建共享的aiohttp会话（连接池+keep-alive，连续请求复用TLS连接）"""
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=10,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=60,
+                ))
+            self.spot.session = self.session
+            self.futures.session = self.session
+
+    async def close_session(self):
+        """关闭交易所与共享会话"""
+        await self.spot.close()
+        await self.futures.close()
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+
+    async def load_markets_cached(self, exchange):
+        """加载市场数据：优先读当日磁盘缓存，未命中才走HTTP并回写缓存"""
+        cache_file = os.path.join(
+            MARKETS_CACHE_DIR, f"{exchange.id}-{time.strftime('%Y%m%d')}.json")
+
+        if os.path.exists(cache_file):
+            with open(cache_file, 'r') as f:
+                exchange.set_markets(json.load(f))
+            return exchange.markets
+
+        markets = await exchange.load_markets()
+        try:
+            os.makedirs(MARKETS_CACHE_DIR, exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump(markets, f)
+        except OSError:
+            pass  # 缓存写失败不影响演示
+        return markets
+
+    async def ensure_markets(self):
+        """显式预加载两个交易所的市场数据（只在启动时做一次）"""
+        await asyncio.gather(
+            self.load_markets_cached(self.spot),
+            self.load_markets_cached(self.futures),
+        )
+
+    async def fetch_both_tickers(self):
+        """并发获取现货和期货行情（优先批量接口，两个请求重叠执行）"""
+        async def one(exchange):
+            if exchange.has.get('fetchTickers'):
+                tickers = await exchange.fetch_tickers([self.symbol])
+                return tickers[self.symbol]
+            return await exchange.fetch_ticker(self.symbol)
+
+        return await asyncio.gather(one(self.spot), one(self.futures))
+
+    async def get_market_overview(self):
         """获取市场概览"""
         try:
             print("=== 市场概览 ===")
 
+            # 现货和期货行情并发获取，省掉一次串行HTTP往返
+            spot_ticker, futures_ticker = await self.fetch_both_tickers()
+
             # 现货市场
-            spot_ticker = self.spot.fetch_ticker(self.symbol)
             print(f"现货 {self.symbol}:")
             print(f"  最新价格: ${spot_ticker['last']:,.2f}")
             print(f"  24小时最高: ${spot_ticker['high']:,.2f}")
@@ -42,7 +109,6 @@ class BinanceSimpleDemo:
             print(f"  24小时成交量: {spot_ticker['baseVolume']:,.2f} BTC")
 
             # 期货市场
-            futures_ticker = self.futures.fetch_ticker(self.symbol)
             print(f"\n期货 {self.symbol}:")
             print(f"  最新价格: ${futures_ticker['last']:,.2f}")
             print(f"  标记价格: ${futures_ticker.get('markPrice', 0):,.2f}")
@@ -69,30 +135,36 @@ class BinanceSimpleDemo:
         except Exception as e:
             print(f"获取市场概览错误: {e}")
 
-    def get_order_book_analysis(self):
+    async def get_order_book_analysis(self):
         """获取订单簿分析"""
         try:
             print(f"\n=== 订单簿分析 ===")
 
-            # 现货订单簿
-            spot_ob = self.spot.fetch_order_book(self.symbol, limit=10)
+            # 两个订单簿请求并发执行
+            spot_ob, futures_ob = await asyncio.gather(
+                self.spot.fetch_order_book(self.symbol, limit=10),
+                self.futures.fetch_order_book(self.symbol, limit=10),
+            )
+
             print(f"现货订单簿 ({self.symbol}):")
 
-            # 计算买卖盘压力
-            spot_bid_volume = sum(bid[1] for bid in spot_ob['bids'][:5])
-            spot_ask_volume = sum(ask[1] for ask in spot_ob['asks'][:5])
+            # 计算买卖盘压力（转成NumPy数组后按量列求和，避免Python级逐档累加）
+            spot_bids = np.asarray(spot_ob['bids'][:5], dtype=np.float64)
+            spot_asks = np.asarray(spot_ob['asks'][:5], dtype=np.float64)
+            spot_bid_volume = spot_bids[:, 1].sum()
+            spot_ask_volume = spot_asks[:, 1].sum()
 
             print(f"  买盘前5档总量: {spot_bid_volume:.4f} BTC")
             print(f"  卖盘前5档总量: {spot_ask_volume:.4f} BTC")
             print(f"  买卖盘比: {spot_bid_volume/spot_ask_volume:.2f}")
 
-            # 期货订单簿
-            futures_ob = self.futures.fetch_order_book(self.symbol, limit=10)
             print(f"\n期货订单簿 ({self.symbol}):")
 
             # 计算买卖盘压力
-            futures_bid_volume = sum(bid[1] for bid in futures_ob['bids'][:5])
-            futures_ask_volume = sum(ask[1] for ask in futures_ob['asks'][:5])
+            futures_bids = np.asarray(futures_ob['bids'][:5], dtype=np.float64)
+            futures_asks = np.asarray(futures_ob['asks'][:5], dtype=np.float64)
+            futures_bid_volume = futures_bids[:, 1].sum()
+            futures_ask_volume = futures_asks[:, 1].sum()
 
             print(f"  买盘前5档总量: {futures_bid_volume:.4f} BTC")
             print(f"  卖盘前5档总量: {futures_ask_volume:.4f} BTC")
@@ -101,12 +173,12 @@ class BinanceSimpleDemo:
         except Exception as e:
             print(f"获取订单簿分析错误: {e}")
 
-    def get_funding_rate_info(self):
+    async def get_funding_rate_info(self):
         """获取资金费率信息"""
         try:
             print(f"\n=== 资金费率信息 ===")
 
-            funding_rate = self.futures.fetch_funding_rate(self.symbol)
+            funding_rate = await self.futures.fetch_funding_rate(self.symbol)
             if funding_rate:
                 rate = funding_rate['fundingRate'] * 100
                 timestamp = funding_rate['fundingTimestamp']
@@ -127,7 +199,7 @@ class BinanceSimpleDemo:
         except Exception as e:
             print(f"获取资金费率信息错误: {e}")
 
-    def get_account_info(self):
+    async def get_account_info(self):
         """获取账户信息（需要API密钥）"""
         try:
             print(f"\n=== 账户信息 ===")
@@ -137,22 +209,24 @@ class BinanceSimpleDemo:
                 print("如需查看账户信息，请在代码中设置apiKey和secret")
                 return
 
-            # 现货账户
-            spot_balance = self.spot.fetch_balance()
+            # 现货与期货账户余额并发获取
+            spot_balance, futures_balance = await asyncio.gather(
+                self.spot.fetch_balance(),
+                self.futures.fetch_balance(),
+            )
+
             print("现货账户余额:")
             for currency, amount in spot_balance['total'].items():
                 if amount > 0:
                     print(f"  {currency}: {amount}")
 
-            # 期货账户
-            futures_balance = self.futures.fetch_balance()
             print(f"\n期货账户余额:")
             for currency, amount in futures_balance['total'].items():
                 if amount > 0:
                     print(f"  {currency}: {amount}")
 
             # 获取持仓信息
-            positions = self.futures.fetch_positions()
+            positions = await self.futures.fetch_positions()
             active_positions = [pos for pos in positions if float(pos['contracts']) != 0]
 
             if active_positions:
@@ -166,72 +240,100 @@ class BinanceSimpleDemo:
         except Exception as e:
             print(f"获取账户信息错误: {e}")
 
-    def simulate_real_time_updates(self, duration=30):
-        """模拟实时数据更新"""
-        print(f"\n=== 模拟实时数据更新 (运行{duration}秒) ===")
-        print("每3秒更新一次价格信息...")
+    def _print_latest_update(self):
+        """现货/期货行情都就绪后打印一次价差分析"""
+        spot_ticker = self.latest.get('spot')
+        futures_ticker = self.latest.get('futures')
+        if not spot_ticker or not futures_ticker:
+            return
+
+        timestamp = time.strftime('%H:%M:%S')
+        spot_price = spot_ticker['last']
+        futures_price = futures_ticker['last']
+        spread = futures_price - spot_price
 
-        start_time = time.time()
-        update_count = 0
+        self.update_count += 1
+        print(f"[{timestamp}] 第{self.update_count}次更新:")
+        print(f"  现货: ${spot_price:,.2f} ({spot_ticker['percentage']:+.2f}%)")
+        print(f"  期货: ${futures_price:,.2f} ({futures_ticker['percentage']:+.2f}%)")
+        print(f"  价差: ${spread:,.2f}")
+
+    async def simulate_real_time_updates(self, duration=30):
+        """实时数据更新（ccxt.pro服务端推送，替代REST轮询）"""
+        print(f"\n=== 实时数据更新 (运行{duration}秒) ===")
 
         try:
-            while time.time() - start_time < duration:
-                try:
-                    # 获取最新价格
-                    spot_ticker = self.spot.fetch_ticker(self.symbol)
-                    futures_ticker = self.futures.fetch_ticker(self.symbol)
-
-                    timestamp = time.strftime('%H:%M:%S')
-                    spot_price = spot_ticker['last']
-                    futures_price = futures_ticker['last']
-                    spread = futures_price - spot_price
-
-                    update_count += 1
-                    print(f"[{timestamp}] 第{update_count}次更新:")
-                    print(f"  现货: ${spot_price:,.2f} ({spot_ticker['percentage']:+.2f}%)")
-                    print(f"  期货: ${futures_price:,.2f} ({futures_ticker['percentage']:+.2f}%)")
-                    print(f"  价差: ${spread:,.2f}")
-
-                    time.sleep(3)  # 每3秒更新一次
-
-                except KeyboardInterrupt:
-                    print(f"\n用户中断")
-                    break
-                except Exception as e:
-                    print(f"更新错误: {e}")
-                    time.sleep(5)
+            import ccxt.pro as ccxtpro
+        except ImportError:
+            print("未安装ccxt.pro，无法使用WebSocket推送")
+            print("运行命令: pip install ccxt-pro")
+            return
+
+        print("WebSocket推送驱动，每个tick即时到达...")
+
+        # 每个watcher把最新行情写入共享字典，价差分析读取两边最新值
+        self.latest: Dict[str, Any] = {'spot': None, 'futures': None}
+        self.update_count = 0
+        self.running = True
+
+        spot_ws = ccxtpro.binance()
+        futures_ws = ccxtpro.binanceusdm()
+        deadline = time.time() + duration
 
+        async def watch(exchange, key):
+            while self.running and time.time() < deadline:
+                ticker = await exchange.watch_ticker(self.symbol)
+                self.latest[key] = ticker
+                self._print_latest_update()
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(watch(spot_ws, 'spot'), watch(futures_ws, 'futures')),
+                timeout=duration,
+            )
+        except asyncio.TimeoutError:
+            pass  # 到时正常结束
         except Exception as e:
             print(f"实时更新错误: {e}")
+        finally:
+            self.running = False
+            await spot_ws.close()
+            await futures_ws.close()
 
-        print(f"\n模拟实时更新完成，共更新{update_count}次")
+        print(f"\n实时更新完成，共更新{self.update_count}次")
 
-    def run_comprehensive_demo(self):
+    async def run_comprehensive_demo(self):
         """运行综合演示"""
         print("=== 币安现货和期货综合演示 ===")
         print("监控交易对:", self.symbol)
         print("注意: 这是基于轮询的演示，要获得真正的实时数据需要ccxt.pro")
 
         try:
+            # 0. 建立共享连接池并预加载市场数据（当日磁盘缓存命中时无网络请求）
+            await self.open_session()
+            await self.ensure_markets()
+
             # 1. 市场概览
-            self.get_market_overview()
+            await self.get_market_overview()
 
             # 2. 订单簿分析
-            self.get_order_book_analysis()
+            await self.get_order_book_analysis()
 
             # 3. 资金费率信息
-            self.get_funding_rate_info()
+            await self.get_funding_rate_info()
 
             # 4. 账户信息
-            self.get_account_info()
+            await self.get_account_info()
 
             # 5. 模拟实时更新
-            self.simulate_real_time_updates(30)  # 运行30秒
+            await self.simulate_real_time_updates(30)  # 运行30秒
 
         except KeyboardInterrupt:
             print(f"\n演示被用户中断")
         except Exception as e:
             print(f"演示运行错误: {e}")
+        finally:
+            await self.close_session()
 
         print(f"\n=== 演示完成 ===")
         print("要获得WebSocket实时数据，请:")
@@ -242,8 +344,8 @@ class BinanceSimpleDemo:
 def main():
     """主函数"""
     demo = BinanceSimpleDemo()
-    demo.run_comprehensive_demo()
+    asyncio.run(demo.run_comprehensive_demo())
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
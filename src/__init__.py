@@ -9,30 +9,49 @@ Version: 1.0.0
 License: MIT
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Power Air"
 __email__ = "powerair@example.com"
 __license__ = "MIT"
 
-from .volume_price_breakout import VolumePriceBreakoutStrategy
-from .strategy import (
+# PEP 562惰性导入：首次访问属性时才加载对应子模块，
+# 只取__version__等元信息时不必支付pandas/numpy/ccxt的导入开销
+_LAZY_IMPORTS = {
+    # Main strategy
+    "VolumePriceBreakoutStrategy": ".volume_price_breakout",
+
     # Enums
-    OrderSide,
-    OrderStatus,
-    StrategyMode,
+    "OrderSide": ".strategy",
+    "OrderStatus": ".strategy",
+    "StrategyMode": ".strategy",
 
     # Dataclasses
-    StrategyParameters,
-    Position,
-    Order,
-    Signal,
+    "StrategyParameters": ".strategy",
+    "Position": ".strategy",
+    "Order": ".strategy",
+    "Signal": ".strategy",
 
     # Managers
-    ExchangeManager,
-    SignalDetector,
-    PositionManager,
-    TechnicalIndicators,
-)
+    "ExchangeManager": ".strategy",
+    "SignalDetector": ".strategy",
+    "PositionManager": ".strategy",
+    "TechnicalIndicators": ".strategy",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # 缓存，后续访问不再走__getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
 __all__ = [
     # Version info
@@ -6,8 +6,8 @@ with clear visualization of entry, add position, and exit signals.
 """
 
 import json
+import sys
 import time
-import random
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
@@ -21,6 +21,18 @@ from src.strategy import (
     Signal,
     OrderSide,
 )
+from src.demos.offline_strategy import (
+    entry_signal_mask,
+    compute_indicators,
+    _prepare_arrays,
+)
+
+
+# Banner strings built once at import instead of re-multiplied per event
+_BANNER_ENTRY = "🚨" * 60
+_BANNER_ADD = "📈" * 50
+_BANNER_EXIT = "🔴" * 60
+_RULE = "=" * 60
 
 
 class SignalDataGenerator:
@@ -51,38 +63,46 @@ class SignalDataGenerator:
             freq='1min'
         )
 
-        data = []
-        current_price = 100000.0
-
-        # Set seed for reproducibility
-        np.random.seed(42)
-
-        for i, timestamp in enumerate(timestamps):
-            open_price = current_price
-
-            # Create deliberate signals every 10 minutes
-            if i % 10 == 5:  # Signal every 10th minute
-                # Strong price movement
-                price_increase = random.uniform(0.008, 0.015)  # 0.8%-1.5%
-                close_price = open_price * (1 + price_increase)
-
-                # High volume
-                volume = 5000 * random.uniform(3, 6)  # 3-6x base volume
-            else:
-                # Normal price movement
-                price_change = np.random.normal(0, 0.002)  # 0.2% volatility
-                close_price = open_price * (1 + price_change)
-                volume = 1000 * random.uniform(0.5, 1.5)  # Normal volume
-
-            # Generate high/low prices
-            high_price = max(open_price, close_price) * (1 + abs(np.random.normal(0, 0.001)))
-            low_price = min(open_price, close_price) * (1 - abs(np.random.normal(0, 0.001)))
-
-            data.append([timestamp, open_price, high_price, low_price, close_price, volume])
-            current_price = close_price
-
-        df = pd.DataFrame(data, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-        df.set_index('timestamp', inplace=True)
+        n = len(timestamps)
+        base_price = 100000.0
+
+        # Single PCG64 generator, seeded for reproducibility
+        rng = np.random.default_rng(42)
+
+        # Create deliberate signals every 10 minutes; all random vectors
+        # are drawn in bulk instead of once per candle
+        signal_mask = np.arange(n) % 10 == 5  # Signal every 10th minute
+        returns = np.where(signal_mask,
+                           rng.uniform(0.008, 0.015, n),  # 0.8%-1.5% strong move
+                           rng.normal(0, 0.002, n))  # 0.2% volatility
+
+        # Price path as cumulative product; each open is the previous close
+        close_price = base_price * np.cumprod(1 + returns)
+        open_price = np.concatenate(([base_price], close_price[:-1]))
+
+        # Generate high/low prices
+        high_price = np.maximum(open_price, close_price) * (1 + np.abs(rng.normal(0, 0.001, n)))
+        low_price = np.minimum(open_price, close_price) * (1 - np.abs(rng.normal(0, 0.001, n)))
+
+        # High volume on signal candles (3-6x base), normal otherwise
+        volume = np.where(signal_mask,
+                          5000 * rng.uniform(3, 6, n),
+                          1000 * rng.uniform(0.5, 1.5, n))
+
+        df = pd.DataFrame({
+            'open': open_price,
+            'high': high_price,
+            'low': low_price,
+            'close': close_price,
+            'volume': volume,
+        }, index=timestamps)
+        df.index.name = 'timestamp'
+
+        # float32 is plenty for simulated OHLCV and halves memory
+        # traffic in the vectorized passes; the cumulative product above
+        # stays float64 to avoid single-precision drift
+        df = df.astype({'open': 'float32', 'high': 'float32', 'low': 'float32',
+                        'close': 'float32', 'volume': 'float32'})
 
         # Calculate indicators
         df = self._calculate_indicators(df)
@@ -91,11 +111,16 @@ class SignalDataGenerator:
         return df
 
     def _calculate_indicators(self, df: pd.DataFrame, volume_period: int = 20) -> pd.DataFrame:
-        """Calculate technical indicators."""
-        df['volume_ma'] = df['volume'].rolling(window=volume_period).mean()
-        df['volume_ratio'] = df['volume'] / df['volume_ma']
-        df['price_change_pct'] = ((df['close'] - df['open']) / df['open'] * 100)
-        return df
+        """Calculate technical indicators in a single assign pass."""
+        arrays = _prepare_arrays(df)
+        volume_ma, volume_ratio, price_change_pct = compute_indicators(
+            arrays, volume_period
+        )
+        return df.assign(
+            volume_ma=volume_ma,
+            volume_ratio=volume_ratio,
+            price_change_pct=price_change_pct,
+        )
 
 
 class SignalDemoStrategy:
@@ -109,9 +134,19 @@ class SignalDemoStrategy:
         """
         self.parameters = parameters
         self.symbol = "BTC/USDT"
-        self.positions = []
         self.current_price = 100000.0
 
+        # Positions in structure-of-arrays layout: parallel float64
+        # arrays plus an active count, so per-bar updates are contiguous
+        # vectorized passes instead of dict lookups per position
+        cap = parameters.max_positions
+        self.pos_entry_price = np.empty(cap)
+        self.pos_quantity = np.empty(cap)
+        self.pos_highest_price = np.empty(cap)
+        self.pos_stop_loss_price = np.empty(cap)
+        self.pos_total_invested = np.empty(cap)
+        self.n_positions = 0
+
         self._print_parameters()
 
     def _print_parameters(self) -> None:
@@ -123,18 +158,25 @@ class SignalDemoStrategy:
         print(f"   Add Position Threshold (U): {self.parameters.add_position_threshold}%")
         print(f"   Stop Loss Threshold (S): {self.parameters.stop_loss_threshold}%")
 
-    def check_entry_signal(self, kline_data: Dict, timestamp: datetime) -> Optional[Signal]:
-        """Check for entry signal."""
-        volume_breakout = kline_data['volume_ratio'] >= self.parameters.volume_multiplier
-        price_breakout = kline_data['price_change_pct'] >= self.parameters.price_change_threshold
+    def check_entry_signal(
+        self,
+        close: float,
+        volume: float,
+        volume_ratio: float,
+        price_change_pct: float,
+        timestamp: datetime,
+    ) -> Optional[Signal]:
+        """Check for entry signal from scalar column values."""
+        volume_breakout = volume_ratio >= self.parameters.volume_multiplier
+        price_breakout = price_change_pct >= self.parameters.price_change_threshold
 
         if volume_breakout and price_breakout:
             return Signal(
                 signal_type="ENTRY",
-                price=kline_data['close'],
-                volume=kline_data['volume'],
-                volume_ratio=kline_data['volume_ratio'],
-                price_change=kline_data['price_change_pct'],
+                price=close,
+                volume=volume,
+                volume_ratio=volume_ratio,
+                price_change=price_change_pct,
                 timestamp=timestamp,
                 symbol=self.symbol
             )
@@ -142,113 +184,140 @@ class SignalDemoStrategy:
 
     def execute_entry(self, signal: Signal) -> None:
         """Execute entry with visual feedback."""
+        if self.n_positions >= self.parameters.max_positions:
+            return
+
         position_size = 0.01  # Fixed size for demo
 
-        position = {
-            'symbol': self.symbol,
-            'entry_price': signal.price,
-            'quantity': position_size,
-            'entry_time': signal.timestamp,
-            'highest_price': signal.price,
-            'stop_loss_price': signal.price * (1 - self.parameters.stop_loss_threshold / 100),
-            'total_invested': signal.price * position_size
-        }
+        i = self.n_positions
+        self.pos_entry_price[i] = signal.price
+        self.pos_quantity[i] = position_size
+        self.pos_highest_price[i] = signal.price
+        self.pos_stop_loss_price[i] = signal.price * (1 - self.parameters.stop_loss_threshold / 100)
+        self.pos_total_invested[i] = signal.price * position_size
+        self.n_positions += 1
 
-        self.positions.append(position)
-        self._print_entry_execution(signal, position)
+        self._print_entry_execution(signal, i)
 
-    def _print_entry_execution(self, signal: Signal, position: Dict) -> None:
+    def _print_entry_execution(self, signal: Signal, index: int) -> None:
         """Print entry execution with clear formatting."""
-        print("\n" + "🚨" * 60)
+        print("\n" + _BANNER_ENTRY)
         print("🚨【ENTRY SIGNAL EXECUTED!】")
         print(f"💰 Entry Price: ${signal.price:,.2f}")
-        print(f"📊 Position Size: {position['quantity']:.6f} BTC")
+        print(f"📊 Position Size: {self.pos_quantity[index]:.6f} BTC")
         print(f"📈 Volume Ratio: {signal.volume_ratio:.2f}x (Threshold: {self.parameters.volume_multiplier}x)")
         print(f"📊 Price Change: {signal.price_change:+.2f}% (Threshold: {self.parameters.price_change_threshold}%)")
-        print(f"📍 Stop Loss: ${position['stop_loss_price']:,.2f}")
-        print("🚨" * 60)
-
-    def check_add_position_signal(self, position: Dict, current_price: float) -> bool:
-        """Check for add position signal."""
-        price_increase_pct = ((current_price - position['entry_price']) / position['entry_price'] * 100)
-        return price_increase_pct >= self.parameters.add_position_threshold
+        print(f"📍 Stop Loss: ${self.pos_stop_loss_price[index]:,.2f}")
+        print(_BANNER_ENTRY)
 
-    def execute_add_position(self, position: Dict) -> None:
-        """Execute add position."""
+    def execute_add_position(self, index: int) -> None:
+        """Execute add position on the position at the given slot."""
         additional_size = 0.005  # Fixed additional size
         additional_cost = self.current_price * additional_size
 
         # Update position
-        total_quantity = position['quantity'] + additional_size
-        total_cost = position['total_invested'] + additional_cost
+        total_quantity = self.pos_quantity[index] + additional_size
+        total_cost = self.pos_total_invested[index] + additional_cost
 
-        position['quantity'] = total_quantity
-        position['entry_price'] = total_cost / total_quantity
-        position['total_invested'] = total_cost
+        self.pos_quantity[index] = total_quantity
+        self.pos_entry_price[index] = total_cost / total_quantity
+        self.pos_total_invested[index] = total_cost
 
-        self._print_add_position_execution(position)
+        self._print_add_position_execution(index)
 
-    def _print_add_position_execution(self, position: Dict) -> None:
+    def _print_add_position_execution(self, index: int) -> None:
         """Print add position execution."""
-        print("\n" + "📈" * 50)
+        print("\n" + _BANNER_ADD)
         print("📈【ADD POSITION SIGNAL EXECUTED!】")
         print(f"💰 Add Price: ${self.current_price:,.2f}")
         print(f"📊 Additional Size: {0.005:.6f} BTC")
-        print(f"💼 New Average Price: ${position['entry_price']:,.2f}")
-        print(f"📈 Total Quantity: {position['quantity']:.6f} BTC")
-        print("📈" * 50)
-
-    def check_exit_signal(self, position: Dict, current_price: float) -> bool:
-        """Check for exit signal."""
-        # Update highest price first
-        if current_price > position['highest_price']:
-            position['highest_price'] = current_price
-            position['stop_loss_price'] = position['highest_price'] * (
-                1 - self.parameters.stop_loss_threshold / 100
-            )
+        print(f"💼 New Average Price: ${self.pos_entry_price[index]:,.2f}")
+        print(f"📈 Total Quantity: {self.pos_quantity[index]:.6f} BTC")
+        print(_BANNER_ADD)
 
-        drawdown_pct = ((position['highest_price'] - current_price) / position['highest_price'] * 100)
-        return drawdown_pct >= self.parameters.stop_loss_threshold
+    def execute_exit(self, index: int) -> None:
+        """Execute exit: report PnL, then swap the last active slot in.
 
-    def execute_exit(self, position: Dict) -> None:
-        """Execute exit."""
+        Swap-with-last keeps the active arrays dense with O(1) removal
+        instead of an O(n) ``list.remove`` scan.
+        """
         exit_price = self.current_price
-        pnl = (exit_price - position['entry_price']) * position['quantity']
-        pnl_pct = ((exit_price - position['entry_price']) / position['entry_price'] * 100)
+        pnl = (exit_price - self.pos_entry_price[index]) * self.pos_quantity[index]
+        pnl_pct = ((exit_price - self.pos_entry_price[index]) / self.pos_entry_price[index] * 100)
+
+        self._print_exit_execution(index, pnl, pnl_pct)
 
-        self._print_exit_execution(position, pnl, pnl_pct)
-        self.positions.remove(position)
+        last = self.n_positions - 1
+        if index != last:
+            self.pos_entry_price[index] = self.pos_entry_price[last]
+            self.pos_quantity[index] = self.pos_quantity[last]
+            self.pos_highest_price[index] = self.pos_highest_price[last]
+            self.pos_stop_loss_price[index] = self.pos_stop_loss_price[last]
+            self.pos_total_invested[index] = self.pos_total_invested[last]
+        self.n_positions = last
 
-    def _print_exit_execution(self, position: Dict, pnl: float, pnl_pct: float) -> None:
+    def _print_exit_execution(self, index: int, pnl: float, pnl_pct: float) -> None:
         """Print exit execution."""
-        print("\n" + "🔴" * 60)
+        print("\n" + _BANNER_EXIT)
         print("🔴【EXIT SIGNAL EXECUTED!】")
         print(f"💰 Exit Price: ${self.current_price:,.2f}")
-        print(f"📊 Entry Price: ${position['entry_price']:,.2f}")
-        print(f"💼 Position Size: {position['quantity']:.6f} BTC")
-        print(f"⬆️  Highest Price: ${position['highest_price']:,.2f}")
-        print(f"🛑 Stop Loss: ${position['stop_loss_price']:,.2f}")
+        print(f"📊 Entry Price: ${self.pos_entry_price[index]:,.2f}")
+        print(f"💼 Position Size: {self.pos_quantity[index]:.6f} BTC")
+        print(f"⬆️  Highest Price: ${self.pos_highest_price[index]:,.2f}")
+        print(f"🛑 Stop Loss: ${self.pos_stop_loss_price[index]:,.2f}")
         print(f"💵 PnL Amount: ${pnl:+.2f}")
         print(f"📊 PnL Percentage: {pnl_pct:+.2f}%")
-        print("🔴" * 60)
+        print(_BANNER_EXIT)
+
+    def update_all_positions(self, current_price: float) -> None:
+        """Update every active position with vectorized masks.
+
+        Add-position and exit conditions are evaluated across all active
+        slots in single NumPy passes; exits remove slots via swap-with-last.
+        """
+        n = self.n_positions
+        if n == 0:
+            return
+
+        entry = self.pos_entry_price[:n]
+        highest = self.pos_highest_price[:n]
+
+        # Add-position signals (mask computed before any slot mutates)
+        price_increase_pct = (current_price - entry) / entry * 100
+        for i in np.flatnonzero(price_increase_pct >= self.parameters.add_position_threshold):
+            self.execute_add_position(int(i))
+
+        # Trail the highest price and stop loss
+        np.maximum(highest, current_price, out=highest)
+        self.pos_stop_loss_price[:n] = highest * (1 - self.parameters.stop_loss_threshold / 100)
+
+        # Exit signals; iterate indices in reverse so swap-with-last
+        # never disturbs a not-yet-visited slot
+        drawdown_pct = (highest - current_price) / highest * 100
+        for i in np.flatnonzero(drawdown_pct >= self.parameters.stop_loss_threshold)[::-1]:
+            self.execute_exit(int(i))
 
     def print_positions_status(self) -> None:
         """Print current positions status."""
-        if not self.positions:
+        n = self.n_positions
+        if n == 0:
             return
 
-        print(f"\n📊【CURRENT POSITIONS STATUS】")
-        for i, pos in enumerate(self.positions, 1):
-            current_pnl = (self.current_price - pos['entry_price']) * pos['quantity']
-            pnl_pct = ((self.current_price - pos['entry_price']) / pos['entry_price'] * 100)
+        # PnL for all positions in one vectorized pass
+        entry = self.pos_entry_price[:n]
+        quantity = self.pos_quantity[:n]
+        pnl = (self.current_price - entry) * quantity
+        pnl_pct = (self.current_price - entry) / entry * 100
 
-            print(f"Position {i}:")
-            print(f"  Entry Price: ${pos['entry_price']:,.2f}")
+        print(f"\n📊【CURRENT POSITIONS STATUS】")
+        for i in range(n):
+            print(f"Position {i + 1}:")
+            print(f"  Entry Price: ${entry[i]:,.2f}")
             print(f"  Current Price: ${self.current_price:,.2f}")
-            print(f"  Quantity: {pos['quantity']:.6f} BTC")
-            print(f"  Highest Price: ${pos['highest_price']:,.2f}")
-            print(f"  Stop Loss: ${pos['stop_loss_price']:,.2f}")
-            print(f"  PnL: ${current_pnl:+.2f} ({pnl_pct:+.2f}%)")
+            print(f"  Quantity: {quantity[i]:.6f} BTC")
+            print(f"  Highest Price: ${self.pos_highest_price[i]:,.2f}")
+            print(f"  Stop Loss: ${self.pos_stop_loss_price[i]:,.2f}")
+            print(f"  PnL: ${pnl[i]:+.2f} ({pnl_pct[i]:+.2f}%)")
 
 
 def create_demo_parameters(
@@ -283,12 +352,16 @@ def create_demo_parameters(
     )
 
 
-def main() -> None:
-    """Main function."""
+def main(*, visual: bool = False) -> None:
+    """Main function.
+
+    Args:
+        visual: Pause briefly after each bar for human-paced output.
+    """
     print("🎯 Volume Price Breakout Signal Demonstration")
-    print("=" * 60)
+    print(_RULE)
     print("💡 Lower threshold parameters for frequent signal generation")
-    print("=" * 60)
+    print(_RULE)
 
     # Create strategy with optimized parameters
     parameters = create_demo_parameters(
@@ -306,54 +379,64 @@ def main() -> None:
     klines_data = data_generator.generate_signal_rich_klines(40)
 
     print(f"\n📈 Starting signal simulation...")
-    print("=" * 60)
+    print(_RULE)
+
+    # Extract typed column arrays once; the loop indexes scalars
+    # instead of boxing each row into a Series/dict
+    arrays = _prepare_arrays(klines_data)
+    close_arr = arrays.close
+    vol_arr = arrays.volume
+    vr_arr = klines_data['volume_ratio'].to_numpy()
+    pcp_arr = klines_data['price_change_pct'].to_numpy()
+    ts_index = klines_data.index
+    # Format all bar timestamps in one vectorized C pass
+    ts_strs = ts_index.strftime('%H:%M:%S').to_numpy()
+
+    # Entry conditions are a pure two-threshold AND, so the whole signal
+    # mask is one compiled compare pass instead of a per-bar Python check
+    entry_mask = entry_signal_mask(
+        vr_arr, pcp_arr,
+        float(strategy.parameters.volume_multiplier),
+        float(strategy.parameters.price_change_threshold),
+    )
 
     signal_count = 0
-    for i, (timestamp, kline) in enumerate(klines_data.iterrows()):
-        if i < 20:  # Skip first candles for indicator calculation
-            continue
-
-        strategy.current_price = float(kline['close'])
-
-        print(f"\n⏰ {timestamp.strftime('%H:%M:%S')}")
-        print(f"💰 Price: ${strategy.current_price:,.2f} ({kline['price_change_pct']:+.2f}%)")
-        print(f"📊 Volume: {kline['volume']:,.0f} (ratio: {kline['volume_ratio']:.2f}x)")
+    for i in range(20, len(close_arr)):  # Skip first candles for indicator calculation
+        timestamp = ts_index[i]
+        strategy.current_price = float(close_arr[i])
+
+        # One buffered write per bar instead of three print calls
+        sys.stdout.write(
+            f"\n⏰ {ts_strs[i]}\n"
+            f"💰 Price: ${strategy.current_price:,.2f} ({pcp_arr[i]:+.2f}%)\n"
+            f"📊 Volume: {vol_arr[i]:,.0f} (ratio: {vr_arr[i]:.2f}x)\n"
+        )
 
-        # Check entry signal
-        signal = strategy.check_entry_signal(kline.to_dict(), timestamp)
+        # Check entry signal only on bars the precomputed mask flagged
+        signal = None
+        if entry_mask[i]:
+            signal = strategy.check_entry_signal(
+                strategy.current_price, vol_arr[i], vr_arr[i], pcp_arr[i], timestamp)
         if signal:
             signal_count += 1
             strategy.execute_entry(signal)
 
-        # Update positions
-        positions_to_close = []
-        for position in strategy.positions:
-            # Check add position
-            if strategy.check_add_position_signal(position, strategy.current_price):
-                strategy.execute_add_position(position)
-
-            # Check exit signal
-            if strategy.check_exit_signal(position, strategy.current_price):
-                strategy.execute_exit(position)
-                positions_to_close.append(position)
-
-        # Remove closed positions
-        for pos in positions_to_close:
-            if pos in strategy.positions:
-                strategy.positions.remove(pos)
+        # Update positions (adds, trailing stops and exits in one pass)
+        strategy.update_all_positions(strategy.current_price)
 
         # Print status periodically
         if i % 5 == 0 or signal:
             strategy.print_positions_status()
 
-        time.sleep(0.2)  # Visual delay
+        if visual:
+            time.sleep(0.2)  # Visual delay
 
     # Final summary
     print(f"\n🏁 Simulation completed!")
     print(f"📊 Total Entry Signals: {signal_count}")
-    print(f"📈 Final Positions: {len(strategy.positions)}")
+    print(f"📈 Final Positions: {strategy.n_positions}")
 
-    if strategy.positions:
+    if strategy.n_positions:
         strategy.print_positions_status()
     else:
         print("💼 All positions closed")
@@ -371,4 +454,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(visual=True)
\ No newline at end of file
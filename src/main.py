@@ -6,14 +6,16 @@ volume price breakout strategy with various modes and configurations.
 """
 
 import argparse
-import asyncio
 import json
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-from src import VolumePriceBreakoutStrategy, __version__, __author__
+# src/__init__ is metadata plus lazy re-exports, so this only loads the
+# version constants; the strategy itself is imported where it is run
+from src import __version__, __author__
 
 
 def setup_logging(level: str = "INFO") -> None:
@@ -29,61 +31,204 @@ def setup_logging(level: str = "INFO") -> None:
     )
 
 
-def validate_config(config_path: str) -> bool:
-    """Validate strategy configuration.
+def _load_json(path: str) -> Dict[str, Any]:
+    """Load a JSON file through the shared stat-keyed config cache.
+
+    Repeated loads of the same unchanged file within one process (e.g.
+    validate + run + info for --live) parse it once. The underlying
+    parser prefers orjson, whose JSONDecodeError subclasses
+    json.JSONDecodeError, so callers' error handling is unaffected.
 
     Args:
-        config_path: Path to configuration file.
+        path: Path to the JSON file.
 
     Returns:
-        True if valid, False otherwise.
+        Parsed configuration dictionary.
+    """
+    from src.utils.config import load_config_cached
+
+    return load_config_cached(path)
+
+
+# Declarative form of the required sections, required parameters and
+# range checks below; compiled once into a reusable validator
+_CONFIG_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["strategy", "trading", "parameters"],
+    "properties": {
+        "parameters": {
+            "type": "object",
+            "required": [
+                "volume_period", "volume_multiplier", "price_change_threshold",
+                "capital_usage_percent", "add_position_threshold",
+                "stop_loss_threshold",
+            ],
+            "properties": {
+                "volume_period": {
+                    "type": "number", "exclusiveMinimum": 0, "maximum": 200,
+                },
+                "volume_multiplier": {
+                    "type": "number", "exclusiveMinimum": 0, "maximum": 10,
+                },
+                "price_change_threshold": {
+                    "type": "number", "minimum": 0, "maximum": 50,
+                },
+                "capital_usage_percent": {
+                    "type": "number", "exclusiveMinimum": 0, "maximum": 100,
+                },
+            },
+        },
+    },
+}
+
+_config_validator = None
+_fast_validator = None
+
+
+def _fast_path_valid(config) -> Optional[bool]:
+    """Validate via fastjsonschema's code-generated validator when installed.
+
+    Returns True when the compiled validator accepts the config, False
+    when it rejects it, and None when fastjsonschema is unavailable.
     """
+    global _fast_validator
+    if _fast_validator is None:
+        try:
+            import fastjsonschema
+        except ImportError:
+            _fast_validator = False
+            return None
+        _fast_validator = (
+            fastjsonschema.compile(_CONFIG_SCHEMA),
+            fastjsonschema.JsonSchemaException,
+        )
+    if _fast_validator is False:
+        return None
+    validate, schema_error = _fast_validator
     try:
-        if not Path(config_path).exists():
-            print(f"❌ Configuration file not found: {config_path}")
-            return False
+        validate(config)
+    except schema_error:
+        return False
+    return True
 
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
-
-        # Check required sections
-        required_sections = ["strategy", "trading", "parameters"]
-        for section in required_sections:
-            if section not in config:
-                print(f"❌ Missing required configuration section: {section}")
-                return False
-
-        # Check required parameters
-        required_params = [
-            "volume_period", "volume_multiplier", "price_change_threshold",
-            "capital_usage_percent", "add_position_threshold", "stop_loss_threshold"
-        ]
-        for param in required_params:
-            if param not in config["parameters"]:
-                print(f"❌ Missing required parameter: {param}")
-                return False
-
-        # Validate parameter ranges
-        params = config["parameters"]
-        if params["volume_period"] <= 0 or params["volume_period"] > 200:
-            print("❌ volume_period must be between 1 and 200")
-            return False
 
-        if params["volume_multiplier"] <= 0 or params["volume_multiplier"] > 10:
-            print("❌ volume_multiplier must be between 0 and 10")
-            return False
+def _get_config_validator():
+    """Compile the config schema on first use and reuse it afterwards.
+
+    Returns None when jsonschema is not installed; like fastjsonschema,
+    numba and the other accelerators it is optional, and validation then
+    falls back to the dependency-free checks below.
+    """
+    global _config_validator
+    if _config_validator is None:
+        try:
+            from jsonschema import Draft7Validator
+        except ImportError:
+            _config_validator = False
+            return None
+        _config_validator = Draft7Validator(_CONFIG_SCHEMA)
+    return _config_validator or None
 
-        if not 0 <= params["price_change_threshold"] <= 50:
-            print("❌ price_change_threshold must be between 0 and 50")
-            return False
 
-        if not 0 < params["capital_usage_percent"] <= 100:
-            print("❌ capital_usage_percent must be between 0 and 100")
+def _fallback_schema_errors(config: Dict[str, Any]) -> list:
+    """Check a config against _CONFIG_SCHEMA without any validator library.
+
+    Interprets the same schema dict — required sections, required
+    parameters and the numeric bounds — so the checks cannot drift from
+    what jsonschema/fastjsonschema enforce. Used only when neither
+    library is importable.
+
+    Returns:
+        List of "location: message" strings, empty when valid.
+    """
+    errors = []
+    for section in _CONFIG_SCHEMA["required"]:
+        if section not in config:
+            errors.append(f"config: '{section}' is a required property")
+
+    params_schema = _CONFIG_SCHEMA["properties"]["parameters"]
+    params = config.get("parameters")
+    if not isinstance(params, dict):
+        return errors
+
+    for name in params_schema["required"]:
+        if name not in params:
+            errors.append(f"parameters: '{name}' is a required property")
+    for name, rules in params_schema["properties"].items():
+        if name not in params:
+            continue
+        value = params[name]
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            errors.append(f"parameters.{name}: {value!r} is not of type 'number'")
+            continue
+        if "exclusiveMinimum" in rules and value <= rules["exclusiveMinimum"]:
+            errors.append(
+                f"parameters.{name}: {value} is less than or equal to "
+                f"the minimum of {rules['exclusiveMinimum']}"
+            )
+        elif "minimum" in rules and value < rules["minimum"]:
+            errors.append(
+                f"parameters.{name}: {value} is less than "
+                f"the minimum of {rules['minimum']}"
+            )
+        if "maximum" in rules and value > rules["maximum"]:
+            errors.append(
+                f"parameters.{name}: {value} is greater than "
+                f"the maximum of {rules['maximum']}"
+            )
+    return errors
+
+
+def validate_config(config_path: str) -> bool:
+    """Validate strategy configuration.
+
+    Args:
+        config_path: Path to configuration file.
+
+    Returns:
+        True if valid, False otherwise.
+    """
+    try:
+        # No separate exists() probe: the load below stats the file anyway
+        # (for its cache key), so a missing file surfaces as
+        # FileNotFoundError and the extra syscall/TOCTOU window goes away.
+        config = _load_json(config_path)
+
+        # Fast path: the generated validator accepts a valid config without
+        # building any error objects. On rejection (or when fastjsonschema
+        # is not installed) fall through to jsonschema, which reports every
+        # violation with its location.
+        if _fast_path_valid(config):
+            print("✅ Configuration validation passed")
+            return True
+
+        validator = _get_config_validator()
+        if validator is not None:
+            errors = [
+                f"{'.'.join(str(p) for p in error.absolute_path) or 'config'}: "
+                f"{error.message}"
+                for error in sorted(
+                    validator.iter_errors(config),
+                    key=lambda e: list(e.absolute_path),
+                )
+            ]
+        else:
+            # Neither fastjsonschema nor jsonschema is installed; run the
+            # equivalent dependency-free checks so validation never fails
+            # just because the optional libraries are absent
+            errors = _fallback_schema_errors(config)
+
+        if errors:
+            for error in errors:
+                print(f"❌ {error}")
             return False
 
         print("✅ Configuration validation passed")
         return True
 
+    except FileNotFoundError:
+        print(f"❌ Configuration file not found: {config_path}")
+        return False
     except json.JSONDecodeError as e:
         print(f"❌ Invalid JSON format: {e}")
         return False
@@ -99,8 +244,7 @@ def print_strategy_info(config_path: str) -> None:
         config_path: Path to configuration file.
     """
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = _load_json(config_path)
 
         params = config["parameters"]
         trading = config["trading"]
@@ -122,6 +266,8 @@ def print_strategy_info(config_path: str) -> None:
         print(f"  Stop Loss (S): {params['stop_loss_threshold']}%")
         print(f"  Max Positions: {params['max_positions']}")
 
+    except FileNotFoundError:
+        print(f"❌ Configuration file not found: {config_path}")
     except Exception as e:
         print(f"❌ Failed to read configuration: {e}")
 
@@ -179,29 +325,28 @@ async def run_live_strategy(config_path: str, dry_run: bool = False) -> None:
         print("🧪 Running in DRY-RUN mode - No actual trades")
 
     try:
+        from src import VolumePriceBreakoutStrategy
+
         strategy = VolumePriceBreakoutStrategy(config_path)
 
-        # Print strategy info
-        print_strategy_info(config_path)
+        # Print the info banner while the strategy brings up its exchange
+        # connection; the synchronous printing runs in a worker thread so
+        # it does not block the event loop during the handshake.
+        import asyncio
 
-        # Start strategy
-        await strategy.run()
+        await asyncio.gather(
+            asyncio.to_thread(print_strategy_info, config_path),
+            strategy.run(),
+        )
 
     except Exception as e:
         print(f"❌ Strategy execution failed: {e}")
         sys.exit(1)
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Create command line argument parser.
-
-    Returns:
-        ArgumentParser instance.
-    """
-    parser = argparse.ArgumentParser(
-        description="CCXT CTA Volume Price Breakout Strategy",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f"""
+def _build_epilog() -> str:
+    """Build the help epilog text."""
+    return f"""
 Examples:
   # Run offline demo with default config
   python -m src.main --demo
@@ -224,6 +369,128 @@ Examples:
 Author: {__author__}
 Version: {__version__}
         """
+
+
+class _LazyEpilogParser(argparse.ArgumentParser):
+    """Parser that only formats the example epilog when help is shown."""
+
+    def format_help(self) -> str:
+        if self.epilog is None:
+            self.epilog = _build_epilog()
+        return super().format_help()
+
+
+# Default Unix socket for daemon mode; override with --socket or the
+# SRC_CLI_DAEMON environment variable on the client side
+DEFAULT_SOCKET_PATH = "/tmp/ccxt_cta_cli.sock"
+
+
+async def run_daemon(socket_path: str) -> None:
+    """Serve CLI commands over a local Unix socket.
+
+    Repeated validate/info invocations from shell scripts or
+    supervisors normally pay full interpreter and import startup each
+    time. Daemon mode keeps one warm process around: clients send
+    JSON-lines requests like {"cmd": "validate_config", "args": {...}}
+    and receive a JSON response with the captured output, so each call
+    costs a socket round-trip instead of a cold start. The module-level
+    config cache persists across requests.
+
+    Args:
+        socket_path: Path of the Unix socket to bind.
+    """
+    import asyncio
+    import contextlib
+    import io
+    import os
+
+    stop_event = asyncio.Event()
+
+    async def handle_client(reader, writer) -> None:
+        while not reader.at_eof():
+            line = await reader.readline()
+            if not line:
+                break
+            response: Dict[str, Any]
+            try:
+                request = json.loads(line)
+                cmd = request.get("cmd")
+                args = request.get("args", {})
+
+                out = io.StringIO()
+                with contextlib.redirect_stdout(out):
+                    if cmd == "ping":
+                        ok = True
+                    elif cmd == "validate_config":
+                        ok = validate_config(args.get("config", "strategy_config.json"))
+                    elif cmd == "info":
+                        print_strategy_info(args.get("config", "strategy_config.json"))
+                        ok = True
+                    elif cmd == "shutdown":
+                        ok = True
+                        stop_event.set()
+                    else:
+                        print(f"❌ Unknown command: {cmd}")
+                        ok = False
+
+                response = {"ok": ok, "output": out.getvalue()}
+            except Exception as e:
+                response = {"ok": False, "output": f"❌ {e}\n"}
+
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_unix_server(handle_client, path=socket_path)
+    print(f"🔌 CLI daemon listening on {socket_path}")
+    try:
+        async with server:
+            await stop_event.wait()
+    finally:
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        print("🔌 CLI daemon stopped")
+
+
+def send_request(socket_path: str, cmd: str, args: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Send one command to a running CLI daemon.
+
+    Uses only the stdlib socket module so client invocations stay as
+    light as possible.
+
+    Args:
+        socket_path: Path of the daemon's Unix socket.
+        cmd: Command name (e.g. "validate_config").
+        args: Optional command arguments.
+
+    Returns:
+        Response dictionary with "ok" and "output" keys.
+    """
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        sock.sendall(json.dumps({"cmd": cmd, "args": args or {}}).encode() + b"\n")
+        chunks = []
+        while True:
+            data = sock.recv(65536)
+            if not data:
+                break
+            chunks.append(data)
+            if data.endswith(b"\n"):
+                break
+    return json.loads(b"".join(chunks))
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create command line argument parser.
+
+    Returns:
+        ArgumentParser instance.
+    """
+    parser = _LazyEpilogParser(
+        description="CCXT CTA Volume Price Breakout Strategy",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
     parser.add_argument(
@@ -274,6 +541,18 @@ Version: {__version__}
         help="Print strategy information"
     )
 
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run as a CLI daemon serving commands over a Unix socket"
+    )
+
+    parser.add_argument(
+        "--socket",
+        default=DEFAULT_SOCKET_PATH,
+        help=f"Unix socket path for daemon mode (default: {DEFAULT_SOCKET_PATH})"
+    )
+
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -286,15 +565,33 @@ Version: {__version__}
 
 def main() -> None:
     """Main entry point."""
+    # --version needs nothing beyond the constants; answer it before
+    # paying for parser construction
+    if "--version" in sys.argv[1:]:
+        print(f"{Path(sys.argv[0]).name} {__version__}")
+        sys.exit(0)
+
     parser = create_parser()
     args = parser.parse_args()
 
-    # Setup logging
-    setup_logging(args.log_level)
-
-    # Handle different modes
+    # When a daemon is advertised, route the cheap query commands to it
+    # instead of re-doing the work in this cold process
+    daemon_socket = os.environ.get("SRC_CLI_DAEMON")
+    if daemon_socket and (args.validate_config or args.info):
+        cmd = "validate_config" if args.validate_config else "info"
+        response = send_request(daemon_socket, cmd, {"config": args.config})
+        sys.stdout.write(response["output"])
+        sys.exit(0 if response["ok"] else 1)
+
+    # Handle different modes; logging and asyncio are only configured
+    # for the modes that actually run the strategy
     try:
-        if args.validate_config:
+        if args.daemon:
+            import asyncio
+
+            asyncio.run(run_daemon(args.socket))
+
+        elif args.validate_config:
             success = validate_config(args.config)
             sys.exit(0 if success else 1)
 
@@ -302,12 +599,21 @@ def main() -> None:
             print_strategy_info(args.config)
 
         elif args.demo:
+            import asyncio
+
+            setup_logging(args.log_level)
             asyncio.run(run_offline_demo(args.config))
 
         elif args.signal_demo:
+            import asyncio
+
+            setup_logging(args.log_level)
             asyncio.run(run_signal_demo(args.config))
 
         elif args.live:
+            import asyncio
+
+            setup_logging(args.log_level)
             if not validate_config(args.config):
                 sys.exit(1)
             asyncio.run(run_live_strategy(args.config, args.dry_run))
@@ -5,19 +5,39 @@ This module provides a comprehensive implementation of a volume price
 breakout strategy with position management and risk control.
 """
 
-from .base import (
-    OrderSide,
-    OrderStatus,
-    StrategyMode,
-    StrategyParameters,
-    Position,
-    Order,
-    Signal,
-    ExchangeManager,
-    TechnicalIndicators,
-    SignalDetector,
-    PositionManager,
-)
+import importlib
+
+# PEP 562 lazy re-exports: resolve each name from its defining module on
+# first access so importers that only need an enum or dataclass skip the
+# rest of the strategy import chain
+_LAZY_IMPORTS = {
+    "OrderSide": ".enums",
+    "OrderStatus": ".enums",
+    "StrategyMode": ".enums",
+    "StrategyParameters": ".base",
+    "Position": ".base",
+    "Order": ".base",
+    "Signal": ".base",
+    "Kline": ".base",
+    "ExchangeManager": ".base",
+    "TechnicalIndicators": ".base",
+    "SignalDetector": ".base",
+    "PositionManager": ".base",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # Cache so later accesses bypass __getattr__
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     'OrderSide',
@@ -27,8 +47,9 @@ __all__ = [
     'Position',
     'Order',
     'Signal',
+    'Kline',
     'ExchangeManager',
     'TechnicalIndicators',
     'SignalDetector',
     'PositionManager',
-]
\ No newline at end of file
+]
@@ -5,41 +5,25 @@ This module contains the core strategy implementation for detecting
 volume and price breakouts in cryptocurrency markets.
 """
 
+from __future__ import annotations
+
 import asyncio
 import json
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
-from dataclasses import dataclass, field
-from enum import Enum
-
-import ccxt
-import pandas as pd
-import numpy as np
-
-
-class OrderSide(Enum):
-    """Order side enumeration."""
-    BUY = "buy"
-    SELL = "sell"
-
+from typing import TYPE_CHECKING, Dict, List, Optional, Any, Union
+from collections import namedtuple
+from dataclasses import dataclass, field, fields
+from operator import itemgetter
 
-class OrderStatus(Enum):
-    """Order status enumeration."""
-    PENDING = "pending"
-    FILLED = "filled"
-    CANCELLED = "cancelled"
-    FAILED = "failed"
+from .enums import OrderSide, OrderStatus, StrategyMode
 
+if TYPE_CHECKING:  # Heavy imports deferred to the methods that use them
+    import ccxt
+    import pandas as pd
 
-class StrategyMode(Enum):
-    """Strategy mode enumeration."""
-    BACKTEST = "backtest"
-    LIVE = "live"
-    PAPER = "paper"
 
-
-@dataclass
+@dataclass(slots=True)
 class StrategyParameters:
     """Strategy parameters configuration."""
     volume_period: int = 30
@@ -52,8 +36,33 @@ class StrategyParameters:
     min_order_size: float = 0.001
     max_order_size: float = 1.0
 
+    @classmethod
+    def from_mapping(cls, params: Dict[str, Any]) -> StrategyParameters:
+        """Build parameters from a config ``parameters`` mapping.
+
+        When every key is present — the usual case after validation —
+        all values are extracted with a single itemgetter call; missing
+        keys fall back to the field defaults.
+
+        Args:
+            params: Mapping of parameter names to values.
 
-@dataclass
+        Returns:
+            StrategyParameters object.
+        """
+        if _PARAM_KEY_SET <= params.keys():
+            return cls(*_PARAM_GETTER(params))
+        return cls(**{k: params[k] for k in _PARAM_KEY_SET & params.keys()})
+
+
+# Extraction helpers for StrategyParameters.from_mapping, derived from
+# the dataclass fields so the tuple order always matches the signature
+_PARAM_KEYS = tuple(f.name for f in fields(StrategyParameters))
+_PARAM_KEY_SET = frozenset(_PARAM_KEYS)
+_PARAM_GETTER = itemgetter(*_PARAM_KEYS)
+
+
+@dataclass(slots=True)
 class Position:
     """Position information dataclass."""
     symbol: str
@@ -65,9 +74,12 @@ class Position:
     stop_loss_price: float
     total_invested: float
     current_pnl: float = 0.0
+    # Absolute price at which adding triggers, precomputed from the
+    # entry price so the per-tick check is a single compare
+    add_price: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order information dataclass."""
     order_id: str
@@ -80,9 +92,12 @@ class Order:
     order_type: str = "market"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Signal:
-    """Trading signal dataclass."""
+    """Trading signal dataclass.
+
+    Signals are immutable once emitted; frozen also makes them hashable.
+    """
     signal_type: str
     price: float
     volume: float
@@ -92,6 +107,16 @@ class Signal:
     symbol: str
 
 
+# Lightweight per-candle payload for signal detection. The live loop
+# builds one straight from the raw OHLCV tuple and the incrementally
+# computed indicators — no pandas Series round-trip, no per-field dict
+Kline = namedtuple(
+    'Kline',
+    'symbol timestamp open high low close volume '
+    'volume_ma volume_ratio price_change_pct',
+)
+
+
 class ExchangeManager:
     """Exchange connection manager."""
 
@@ -107,6 +132,8 @@ class ExchangeManager:
 
     async def initialize(self) -> None:
         """Initialize exchange connection."""
+        import ccxt
+
         try:
             # Try ccxt.pro first for WebSocket support
             try:
@@ -151,6 +178,13 @@ class TechnicalIndicators:
     def calculate_volume_ma(df: pd.DataFrame, period: int) -> pd.Series:
         """Calculate volume moving average.
 
+        The rolling mean is computed on the raw ndarray — via
+        Bottleneck's C move_mean when it is installed, otherwise with a
+        cumulative-sum difference — and wrapped back into a Series at
+        the end. Either way it is one O(n) pass with no per-window
+        dispatch, and the first ``period - 1`` values are NaN, matching
+        rolling-mean semantics.
+
         Args:
             df: DataFrame with volume data.
             period: Moving average period.
@@ -158,7 +192,22 @@ class TechnicalIndicators:
         Returns:
             Volume moving average series.
         """
-        return df['volume'].rolling(window=period).mean()
+        import numpy as np
+        import pandas as pd
+
+        volume = df['volume'].to_numpy(np.float64)
+        if len(volume) < period:
+            out = np.full(len(volume), np.nan)
+        else:
+            try:
+                import bottleneck as bn
+            except ImportError:
+                out = np.full(len(volume), np.nan)
+                csum = np.cumsum(np.insert(volume, 0, 0.0))
+                out[period - 1:] = (csum[period:] - csum[:-period]) / period
+            else:
+                out = bn.move_mean(volume, window=period, min_count=period)
+        return pd.Series(out, index=df.index)
 
     @staticmethod
     def calculate_volume_ratio(
@@ -174,7 +223,13 @@ class TechnicalIndicators:
         Returns:
             Volume ratio series.
         """
-        return df['volume'] / volume_ma
+        import pandas as pd
+
+        # Elementwise on the underlying arrays; both inputs share the
+        # DataFrame index so alignment is unnecessary
+        return pd.Series(
+            df['volume'].to_numpy() / volume_ma.to_numpy(), index=df.index
+        )
 
     @staticmethod
     def calculate_price_change_pct(df: pd.DataFrame) -> pd.Series:
@@ -186,7 +241,11 @@ class TechnicalIndicators:
         Returns:
             Price change percentage series.
         """
-        return ((df['close'] - df['open']) / df['open'] * 100)
+        import pandas as pd
+
+        open_ = df['open'].to_numpy()
+        close = df['close'].to_numpy()
+        return pd.Series((close - open_) / open_ * 100.0, index=df.index)
 
 
 class SignalDetector:
@@ -201,31 +260,48 @@ class SignalDetector:
         self.parameters = parameters
         self.logger = logging.getLogger(__name__)
 
-    def detect_entry_signal(self, kline_data: Dict) -> Optional[Signal]:
+    def detect_entry_signal(self, kline_data: Union[Dict, Kline]) -> Optional[Signal]:
         """Detect entry signal based on volume and price breakout.
 
         Args:
-            kline_data: Kline data dictionary.
+            kline_data: Kline data, either a dictionary or a
+                :class:`Kline` tuple.
 
         Returns:
             Signal object if signal detected, None otherwise.
         """
+        # Normalize to a Kline once; the live loop passes one already,
+        # so the hot path is plain attribute access with no dict in sight
+        if isinstance(kline_data, dict):
+            kline_data = Kline(
+                symbol=kline_data['symbol'],
+                timestamp=kline_data['timestamp'],
+                open=kline_data.get('open', 0.0),
+                high=kline_data.get('high', 0.0),
+                low=kline_data.get('low', 0.0),
+                close=kline_data['close'],
+                volume=kline_data['volume'],
+                volume_ma=kline_data.get('volume_ma', 0.0),
+                volume_ratio=kline_data['volume_ratio'],
+                price_change_pct=kline_data['price_change_pct'],
+            )
+
         volume_breakout = (
-            kline_data['volume_ratio'] >= self.parameters.volume_multiplier
+            kline_data.volume_ratio >= self.parameters.volume_multiplier
         )
         price_breakout = (
-            kline_data['price_change_pct'] >= self.parameters.price_change_threshold
+            kline_data.price_change_pct >= self.parameters.price_change_threshold
         )
 
         if volume_breakout and price_breakout:
             return Signal(
                 signal_type="ENTRY",
-                price=kline_data['close'],
-                volume=kline_data['volume'],
-                volume_ratio=kline_data['volume_ratio'],
-                price_change=kline_data['price_change_pct'],
-                timestamp=kline_data['timestamp'],
-                symbol=kline_data['symbol']
+                price=kline_data.close,
+                volume=kline_data.volume,
+                volume_ratio=kline_data.volume_ratio,
+                price_change=kline_data.price_change_pct,
+                timestamp=kline_data.timestamp,
+                symbol=kline_data.symbol
             )
 
         return None
@@ -240,10 +316,12 @@ class SignalDetector:
         Returns:
             True if add position signal triggered, False otherwise.
         """
-        price_increase_pct = (
-            (current_price - position.entry_price) / position.entry_price * 100
+        # Compare against the precomputed absolute trigger; fall back to
+        # deriving it for positions created without one
+        add_price = position.add_price or (
+            position.entry_price * (1 + self.parameters.add_position_threshold / 100)
         )
-        return price_increase_pct >= self.parameters.add_position_threshold
+        return current_price >= add_price
 
     def check_exit_signal(self, position: Position, current_price: float) -> bool:
         """Check if exit signal is triggered.
@@ -262,10 +340,78 @@ class SignalDetector:
                 position.highest_price * (1 - self.parameters.stop_loss_threshold / 100)
             )
 
-        drawdown_pct = (
-            (position.highest_price - current_price) / position.highest_price * 100
-        )
-        return drawdown_pct >= self.parameters.stop_loss_threshold
+        # The stored stop already encodes the drawdown threshold as an
+        # absolute price, so the check is a single compare
+        return current_price <= position.stop_loss_price
+
+
+# Per-tick update kernel, compiled lazily so importing this module stays
+# light. None until the first tick; False when numba is unavailable.
+_tick_kernel = None
+
+
+def _get_tick_kernel():
+    """Return the compiled per-tick kernel, or None when numba is absent.
+
+    The kernel fuses the add-signal compare, the trailing-high update,
+    the stop recompute and the exit compare into one pass over the
+    position arrays, mutating ``highest`` and ``stop`` in place and
+    returning ``(add_mask, exit_mask)``.
+    """
+    global _tick_kernel
+    if _tick_kernel is None:
+        try:
+            from numba import njit
+        except ImportError:
+            _tick_kernel = False
+            return None
+        import numpy as np
+
+        def kernel(current_price, add_price, highest, stop, stop_frac):
+            n = highest.shape[0]
+            add_mask = np.empty(n, np.bool_)
+            exit_mask = np.empty(n, np.bool_)
+            for i in range(n):
+                add_mask[i] = current_price >= add_price[i]
+                h = max(highest[i], current_price)
+                highest[i] = h
+                s = h * (1.0 - stop_frac)
+                stop[i] = s
+                exit_mask[i] = current_price <= s
+            return add_mask, exit_mask
+
+        _tick_kernel = njit(cache=True, nogil=True)(kernel)
+    return _tick_kernel or None
+
+
+class PositionArray:
+    """Structure-of-arrays storage for open positions.
+
+    Numeric position state lives in parallel float64 arrays sized to
+    the position capacity, with an active ``count``; per-tick updates
+    over all positions are then a handful of vectorized NumPy
+    operations instead of per-object Python arithmetic. Non-numeric
+    fields (symbol, entry time) stay in parallel lists.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize position storage.
+
+        Args:
+            capacity: Maximum number of simultaneous positions.
+        """
+        import numpy as np
+
+        self.capacity = capacity
+        self.entry_price = np.zeros(capacity)
+        self.quantity = np.zeros(capacity)
+        self.highest_price = np.zeros(capacity)
+        self.stop_loss_price = np.zeros(capacity)
+        self.total_invested = np.zeros(capacity)
+        self.add_price = np.zeros(capacity)
+        self.symbols: List[str] = []
+        self.entry_times: List[datetime] = []
+        self.count = 0
 
 
 class PositionManager:
@@ -278,9 +424,62 @@ class PositionManager:
             parameters: Strategy parameters.
         """
         self.parameters = parameters
-        self.positions: List[Position] = []
+        self.position_array = PositionArray(parameters.max_positions)
         self.orders: List[Order] = []
         self.logger = logging.getLogger(__name__)
+        # Sizing constants hoisted out of the per-signal path
+        self._invest_frac = parameters.capital_usage_percent / 100.0
+        self._min_size = parameters.min_order_size
+        self._max_size = parameters.max_order_size
+
+    @property
+    def positions(self) -> List[Position]:
+        """Open positions as a list of Position dataclasses.
+
+        This is a materialized view of the underlying arrays kept for
+        API compatibility; hot paths should use the arrays (or
+        :attr:`position_count`) directly.
+        """
+        arr = self.position_array
+        return [
+            Position(
+                symbol=arr.symbols[i],
+                side=OrderSide.BUY,
+                entry_price=float(arr.entry_price[i]),
+                quantity=float(arr.quantity[i]),
+                entry_time=arr.entry_times[i],
+                highest_price=float(arr.highest_price[i]),
+                stop_loss_price=float(arr.stop_loss_price[i]),
+                total_invested=float(arr.total_invested[i]),
+                add_price=float(arr.add_price[i]),
+            )
+            for i in range(arr.count)
+        ]
+
+    @property
+    def position_count(self) -> int:
+        """Number of open positions, without materializing the view."""
+        return self.position_array.count
+
+    def _find_index(self, position: Position) -> int:
+        """Locate the array slot matching a materialized Position.
+
+        Args:
+            position: Position from the :attr:`positions` view.
+
+        Returns:
+            Slot index.
+
+        Raises:
+            ValueError: If no open position matches.
+        """
+        arr = self.position_array
+        for i in range(arr.count):
+            if (arr.symbols[i] == position.symbol
+                    and arr.entry_price[i] == position.entry_price
+                    and arr.quantity[i] == position.quantity):
+                return i
+        raise ValueError(f"Position not found: {position}")
 
     def calculate_position_size(self, account_balance: float, current_price: float) -> float:
         """Calculate position size based on account balance.
@@ -292,15 +491,13 @@ class PositionManager:
         Returns:
             Position size in base currency.
         """
-        invest_amount = account_balance * (self.parameters.capital_usage_percent / 100)
-        position_size = invest_amount / current_price
-
-        # Apply size limits
-        position_size = max(
-            self.parameters.min_order_size,
-            min(position_size, self.parameters.max_order_size)
-        )
+        position_size = account_balance * self._invest_frac / current_price
 
+        # Clamp to the order-size limits
+        if position_size < self._min_size:
+            return self._min_size
+        if position_size > self._max_size:
+            return self._max_size
         return position_size
 
     def add_position(self, signal: Signal, account_balance: float) -> bool:
@@ -313,28 +510,29 @@ class PositionManager:
         Returns:
             True if position added successfully, False otherwise.
         """
-        if len(self.positions) >= self.parameters.max_positions:
-            self.logger.warning(f"⚠️ Max positions ({self.parameters.max_positions}) reached")
+        arr = self.position_array
+        if arr.count >= self.parameters.max_positions:
+            self.logger.warning("⚠️ Max positions (%d) reached", self.parameters.max_positions)
             return False
 
         position_size = self.calculate_position_size(account_balance, signal.price)
 
-        position = Position(
-            symbol=signal.symbol,
-            side=OrderSide.BUY,
-            entry_price=signal.price,
-            quantity=position_size,
-            entry_time=signal.timestamp,
-            highest_price=signal.price,
-            stop_loss_price=signal.price * (1 - self.parameters.stop_loss_threshold / 100),
-            total_invested=signal.price * position_size
-        )
-
-        self.positions.append(position)
-
+        i = arr.count
+        arr.entry_price[i] = signal.price
+        arr.quantity[i] = position_size
+        arr.highest_price[i] = signal.price
+        arr.stop_loss_price[i] = signal.price * (1 - self.parameters.stop_loss_threshold / 100)
+        arr.add_price[i] = signal.price * (1 + self.parameters.add_position_threshold / 100)
+        arr.total_invested[i] = signal.price * position_size
+        arr.symbols.append(signal.symbol)
+        arr.entry_times.append(signal.timestamp)
+        arr.count += 1
+
+        # %-style args defer the string formatting to the logging
+        # framework, so it is skipped entirely when INFO is disabled
         self.logger.info(
-            f"🚨 Entry executed: {signal.symbol} @ ${signal.price:.2f}, "
-            f"size: {position_size:.6f}, vol_ratio: {signal.volume_ratio:.2f}x"
+            "🚨 Entry executed: %s @ $%.2f, size: %.6f, vol_ratio: %.2fx",
+            signal.symbol, signal.price, position_size, signal.volume_ratio,
         )
 
         return True
@@ -350,20 +548,30 @@ class PositionManager:
         Returns:
             True if position added successfully, False otherwise.
         """
+        index = self._find_index(position)
+        return self._add_to_index(index, current_price, account_balance)
+
+    def _add_to_index(self, index: int, current_price: float, account_balance: float) -> bool:
+        """Add to the position in the given array slot."""
+        arr = self.position_array
         additional_size = self.calculate_position_size(account_balance, current_price)
         additional_cost = current_price * additional_size
 
         # Update position
-        total_quantity = position.quantity + additional_size
-        total_cost = position.total_invested + additional_cost
-
-        position.quantity = total_quantity
-        position.entry_price = total_cost / total_quantity
-        position.total_invested = total_cost
+        total_quantity = arr.quantity[index] + additional_size
+        total_cost = arr.total_invested[index] + additional_cost
+
+        arr.quantity[index] = total_quantity
+        arr.entry_price[index] = total_cost / total_quantity
+        arr.total_invested[index] = total_cost
+        # Averaging up moved the entry, so the absolute add trigger moves too
+        arr.add_price[index] = (
+            arr.entry_price[index] * (1 + self.parameters.add_position_threshold / 100)
+        )
 
         self.logger.info(
-            f"📈 Position added: {position.symbol} @ ${current_price:.2f}, "
-            f"additional: {additional_size:.6f}, new avg: ${position.entry_price:.2f}"
+            "📈 Position added: %s @ $%.2f, additional: %.6f, new avg: $%.2f",
+            arr.symbols[index], current_price, additional_size, arr.entry_price[index],
         )
 
         return True
@@ -375,15 +583,35 @@ class PositionManager:
             position: Position to close.
             current_price: Current market price.
         """
-        pnl = (current_price - position.entry_price) * position.quantity
-        pnl_pct = ((current_price - position.entry_price) / position.entry_price * 100)
+        index = self._find_index(position)
+        self._close_index(index, current_price)
+
+    def _close_index(self, index: int, current_price: float) -> None:
+        """Close the position in the given array slot."""
+        arr = self.position_array
+        pnl = (current_price - arr.entry_price[index]) * arr.quantity[index]
+        pnl_pct = ((current_price - arr.entry_price[index]) / arr.entry_price[index] * 100)
 
         self.logger.info(
-            f"🔴 Position closed: {position.symbol} @ ${current_price:.2f}, "
-            f"PnL: ${pnl:+.2f} ({pnl_pct:+.2f}%)"
+            "🔴 Position closed: %s @ $%.2f, PnL: $%+.2f (%+.2f%%)",
+            arr.symbols[index], current_price, pnl, pnl_pct,
         )
 
-        self.positions.remove(position)
+        # O(1) removal: swap the last active slot into the freed index.
+        # Slot order is not part of the API — the positions view and
+        # get_status_summary make no ordering guarantees — and
+        # update_positions walks exit indices in reverse, so a swapped-in
+        # tail element has always been processed already.
+        last = arr.count - 1
+        if index != last:
+            for column in (arr.entry_price, arr.quantity, arr.highest_price,
+                           arr.stop_loss_price, arr.total_invested, arr.add_price):
+                column[index] = column[last]
+            arr.symbols[index] = arr.symbols[last]
+            arr.entry_times[index] = arr.entry_times[last]
+        arr.symbols.pop()
+        arr.entry_times.pop()
+        arr.count = last
 
     def update_positions(self, current_price: float, signal_detector: SignalDetector, account_balance: float) -> None:
         """Update all positions.
@@ -393,20 +621,45 @@ class PositionManager:
             signal_detector: Signal detector instance.
             account_balance: Available account balance.
         """
-        positions_to_close = []
+        import numpy as np
+
+        arr = self.position_array
+        n = arr.count
+        if n == 0:
+            return
+
+        params = signal_detector.parameters
+        stop_frac = params.stop_loss_threshold / 100
+
+        kernel = _get_tick_kernel()
+        if kernel is not None:
+            # Fused single pass: add compare, trailing high, stop
+            # recompute and exit compare per position. Adds never touch
+            # the highest/stop columns, so computing both masks before
+            # acting on either is equivalent to the sequential checks.
+            add_mask, exit_mask = kernel(
+                current_price, arr.add_price[:n],
+                arr.highest_price[:n], arr.stop_loss_price[:n], stop_frac,
+            )
+        else:
+            # Add signal: a single compare against the precomputed trigger
+            add_mask = current_price >= arr.add_price[:n]
+
+            # Trail the highest price and its derived stop in one pass
+            highest = arr.highest_price[:n]
+            np.maximum(highest, current_price, out=highest)
+            arr.stop_loss_price[:n] = highest * (1 - stop_frac)
 
-        for position in self.positions:
-            # Check add position signal
-            if signal_detector.check_add_position_signal(position, current_price):
-                self.add_to_position(position, current_price, account_balance)
+            # Exit signal: the trailing stop already encodes the drawdown
+            # threshold as an absolute price
+            exit_mask = current_price <= arr.stop_loss_price[:n]
 
-            # Check exit signal
-            if signal_detector.check_exit_signal(position, current_price):
-                positions_to_close.append(position)
+        for index in np.flatnonzero(add_mask):
+            self._add_to_index(int(index), current_price, account_balance)
 
-        # Close positions
-        for position in positions_to_close:
-            self.close_position(position, current_price)
+        # Reverse order so earlier indices stay valid while slots close
+        for index in np.flatnonzero(exit_mask)[::-1]:
+            self._close_index(int(index), current_price)
 
     def get_total_pnl(self, current_price: float) -> float:
         """Calculate total PnL for all positions.
@@ -417,9 +670,10 @@ class PositionManager:
         Returns:
             Total PnL.
         """
-        return sum(
-            (current_price - pos.entry_price) * pos.quantity
-            for pos in self.positions
+        arr = self.position_array
+        n = arr.count
+        return float(
+            ((current_price - arr.entry_price[:n]) * arr.quantity[:n]).sum()
         )
 
     def get_status_summary(self, current_price: float) -> Dict[str, Any]:
@@ -431,7 +685,9 @@ class PositionManager:
         Returns:
             Status summary dictionary.
         """
-        if not self.positions:
+        arr = self.position_array
+        n = arr.count
+        if n == 0:
             return {
                 'positions_count': 0,
                 'total_pnl': 0.0,
@@ -440,27 +696,35 @@ class PositionManager:
                 'positions': []
             }
 
-        total_pnl = self.get_total_pnl(current_price)
-        total_invested = sum(pos.total_invested for pos in self.positions)
+        # Per-position PnL in vectorized form; the details list is built
+        # from the resulting arrays
+        entry = arr.entry_price[:n]
+        quantity = arr.quantity[:n]
+        pnl = (current_price - entry) * quantity
+        pnl_pct = (current_price - entry) / entry * 100
+
+        total_pnl = float(pnl.sum())
+        total_invested = float(arr.total_invested[:n].sum())
         pnl_percentage = (total_pnl / total_invested * 100) if total_invested > 0 else 0
 
-        positions_details = []
-        for pos in self.positions:
-            current_pnl = (current_price - pos.entry_price) * pos.quantity
-            pnl_pct = ((current_price - pos.entry_price) / pos.entry_price * 100)
-
-            positions_details.append({
-                'symbol': pos.symbol,
-                'entry_price': pos.entry_price,
-                'quantity': pos.quantity,
-                'highest_price': pos.highest_price,
-                'stop_loss_price': pos.stop_loss_price,
-                'current_pnl': current_pnl,
-                'pnl_percentage': pnl_pct
-            })
+        # Preallocated and filled by index: no list growth while building
+        # the details. The per-row dict shape is kept — it is the
+        # documented return format — but rows are built off the already
+        # computed arrays, not per-object attribute walks.
+        positions_details: List[Dict[str, Any]] = [None] * n  # type: ignore[list-item]
+        for i in range(n):
+            positions_details[i] = {
+                'symbol': arr.symbols[i],
+                'entry_price': float(entry[i]),
+                'quantity': float(quantity[i]),
+                'highest_price': float(arr.highest_price[i]),
+                'stop_loss_price': float(arr.stop_loss_price[i]),
+                'current_pnl': float(pnl[i]),
+                'pnl_percentage': float(pnl_pct[i])
+            }
 
         return {
-            'positions_count': len(self.positions),
+            'positions_count': n,
             'total_pnl': total_pnl,
             'total_invested': total_invested,
             'pnl_percentage': pnl_percentage,
@@ -0,0 +1,30 @@
+"""
+Enumerations for the strategy module.
+
+These live in their own zero-dependency module so code that only needs
+an enum (tests, config validation, demos) can import it without pulling
+in the rest of the strategy stack.
+"""
+
+from enum import Enum
+
+
+class OrderSide(Enum):
+    """Order side enumeration."""
+    BUY = "buy"
+    SELL = "sell"
+
+
+class OrderStatus(Enum):
+    """Order status enumeration."""
+    PENDING = "pending"
+    FILLED = "filled"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+
+class StrategyMode(Enum):
+    """Strategy mode enumeration."""
+    BACKTEST = "backtest"
+    LIVE = "live"
+    PAPER = "paper"
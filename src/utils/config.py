@@ -5,14 +5,136 @@ This module provides utilities for loading, validating, and managing
 strategy configurations.
 """
 
+import copy
+import functools
 import json
 import logging
+import os
+import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List, Union
 
 from src.strategy import StrategyParameters
 
 
+@functools.lru_cache(maxsize=8)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a JSON config file; the stat signature keys the cache."""
+    try:
+        import orjson
+    except ImportError:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return orjson.loads(Path(path).read_bytes())
+
+
+def load_config_cached(path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a JSON configuration, reusing the parsed result when possible.
+
+    The cache key is (path, mtime_ns, size), so repeated loads of an
+    unchanged file — e.g. validate, construct and print info within one
+    CLI run — parse the file once, while any edit invalidates the entry.
+
+    Args:
+        path: Path to the configuration file.
+
+    Returns:
+        Parsed configuration dictionary.
+    """
+    st = os.stat(path)
+    return _parse_config_file(str(path), st.st_mtime_ns, st.st_size)
+
+
+# Sentinel distinguishing an absent key from a falsy value
+_MISSING = object()
+
+# Validation rules, evaluated as data instead of one branch per field.
+# Required fields per section: (section, fields, error template).
+_REQUIRED_FIELDS = (
+    ("strategy", ("name", "version"), "Missing strategy field: {}"),
+    ("trading", ("symbol", "timeframe"), "Missing trading field: {}"),
+    (
+        "parameters",
+        (
+            "volume_period", "volume_multiplier", "price_change_threshold",
+            "capital_usage_percent", "add_position_threshold", "stop_loss_threshold",
+            "max_positions", "min_order_size", "max_order_size",
+        ),
+        "Missing parameter field: {}",
+    ),
+)
+
+# Range rules for parameters:
+# (field, allowed types, lower bound, lower bound is exclusive, upper bound, message)
+_PARAM_RANGE_RULES = (
+    ("volume_period", (int, float), 0, True, 200,
+     "volume_period must be between 1 and 200"),
+    ("volume_multiplier", (int, float), 0, True, 10,
+     "volume_multiplier must be between 0 and 10"),
+    ("price_change_threshold", (int, float), 0, False, 50,
+     "price_change_threshold must be between 0 and 50"),
+    ("capital_usage_percent", (int, float), 0, True, 100,
+     "capital_usage_percent must be between 0 and 100"),
+    ("max_positions", (int,), 0, True, 20,
+     "max_positions must be between 1 and 20"),
+)
+
+
+# Default configuration template, built once at import time;
+# get_default_config hands out deep copies of it.
+_DEFAULT_CONFIG = {
+    "strategy": {
+        "name": "Volume Price Breakout Strategy",
+        "description": "Cryptocurrency trading strategy based on volume and price breakouts",
+        "version": "1.0.0",
+        "mode": "paper"
+    },
+    "trading": {
+        "symbol": "BTC/USDT",
+        "timeframe": "1m",
+        "exchange": "binance",
+        "sandbox": True,
+        "api_key": "",
+        "secret": ""
+    },
+    "parameters": {
+        "volume_period": 30,
+        "volume_multiplier": 2.0,
+        "price_change_threshold": 1.5,
+        "capital_usage_percent": 10,
+        "add_position_threshold": 2.0,
+        "stop_loss_threshold": 3.0,
+        "max_positions": 3,
+        "min_order_size": 0.001,
+        "max_order_size": 1.0
+    },
+    "risk_management": {
+        "max_drawdown": 20,
+        "position_timeout": 3600,
+        "max_daily_loss": 1000,
+        "stop_all_trading": False
+    },
+    "execution": {
+        "slippage": 0.1,
+        "retry_attempts": 3,
+        "retry_delay": 1,
+        "order_timeout": 30,
+        "use_market_orders": True,
+        "partial_fill_handling": "retry"
+    },
+    "monitoring": {
+        "log_level": "INFO",
+        "log_to_file": True,
+        "log_file": "logs/strategy.log",
+        "log_trades": True,
+        "log_signals": True,
+        "metrics_collection": True,
+        "alert_webhook": "",
+        "alert_email": ""
+    }
+}
+
+
 class ConfigManager:
     """Configuration management class."""
 
@@ -47,8 +169,9 @@ class ConfigManager:
             if not config_file.exists():
                 raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-            with open(config_file, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            # Deep copy so merge_configs and other mutations on this
+            # manager never leak into the shared cached dict
+            self.config = copy.deepcopy(load_config_cached(config_file))
 
             self.logger.info(f"✅ Configuration loaded from {config_path}")
 
@@ -60,59 +183,10 @@ class ConfigManager:
         """Get default configuration.
 
         Returns:
-            Default configuration dictionary.
+            Default configuration dictionary (a deep copy of the
+            module-level template, safe for callers to mutate).
         """
-        return {
-            "strategy": {
-                "name": "Volume Price Breakout Strategy",
-                "description": "Cryptocurrency trading strategy based on volume and price breakouts",
-                "version": "1.0.0",
-                "mode": "paper"
-            },
-            "trading": {
-                "symbol": "BTC/USDT",
-                "timeframe": "1m",
-                "exchange": "binance",
-                "sandbox": True,
-                "api_key": "",
-                "secret": ""
-            },
-            "parameters": {
-                "volume_period": 30,
-                "volume_multiplier": 2.0,
-                "price_change_threshold": 1.5,
-                "capital_usage_percent": 10,
-                "add_position_threshold": 2.0,
-                "stop_loss_threshold": 3.0,
-                "max_positions": 3,
-                "min_order_size": 0.001,
-                "max_order_size": 1.0
-            },
-            "risk_management": {
-                "max_drawdown": 20,
-                "position_timeout": 3600,
-                "max_daily_loss": 1000,
-                "stop_all_trading": False
-            },
-            "execution": {
-                "slippage": 0.1,
-                "retry_attempts": 3,
-                "retry_delay": 1,
-                "order_timeout": 30,
-                "use_market_orders": True,
-                "partial_fill_handling": "retry"
-            },
-            "monitoring": {
-                "log_level": "INFO",
-                "log_to_file": True,
-                "log_file": "logs/strategy.log",
-                "log_trades": True,
-                "log_signals": True,
-                "metrics_collection": True,
-                "alert_webhook": "",
-                "alert_email": ""
-            }
-        }
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
     def get_strategy_parameters(self) -> StrategyParameters:
         """Extract strategy parameters from configuration.
@@ -120,23 +194,16 @@ class ConfigManager:
         Returns:
             StrategyParameters object.
         """
-        params_config = self.config.get("parameters", {})
-
-        return StrategyParameters(
-            volume_period=params_config.get("volume_period", 30),
-            volume_multiplier=params_config.get("volume_multiplier", 2.0),
-            price_change_threshold=params_config.get("price_change_threshold", 1.5),
-            capital_usage_percent=params_config.get("capital_usage_percent", 10),
-            add_position_threshold=params_config.get("add_position_threshold", 2.0),
-            stop_loss_threshold=params_config.get("stop_loss_threshold", 3.0),
-            max_positions=params_config.get("max_positions", 3),
-            min_order_size=params_config.get("min_order_size", 0.001),
-            max_order_size=params_config.get("max_order_size", 1.0)
-        )
+        return StrategyParameters.from_mapping(self.config.get("parameters", {}))
 
     def validate_config(self) -> List[str]:
         """Validate configuration and return list of errors.
 
+        The checks are driven by the module-level rule tables
+        (:data:`_REQUIRED_FIELDS`, :data:`_PARAM_RANGE_RULES`), so
+        validation is two tight loops over tuples rather than one
+        hand-written branch per field, and new rules are a table row.
+
         Returns:
             List of validation errors.
         """
@@ -147,71 +214,35 @@ class ConfigManager:
             return errors
 
         # Check required sections
-        required_sections = ["strategy", "trading", "parameters"]
-        for section in required_sections:
+        for section, _, _ in _REQUIRED_FIELDS:
             if section not in self.config:
                 errors.append(f"Missing required section: {section}")
 
-        # Validate strategy section
-        if "strategy" in self.config:
-            strategy_config = self.config["strategy"]
-            strategy_required = ["name", "version"]
-            for field in strategy_required:
-                if field not in strategy_config:
-                    errors.append(f"Missing strategy field: {field}")
-
-        # Validate trading section
-        if "trading" in self.config:
-            trading_config = self.config["trading"]
-            trading_required = ["symbol", "timeframe"]
-            for field in trading_required:
-                if field not in trading_config:
-                    errors.append(f"Missing trading field: {field}")
-
-            # Validate symbol format
-            if "symbol" in trading_config:
-                symbol = trading_config["symbol"]
-                if not isinstance(symbol, str) or "/" not in symbol:
-                    errors.append(f"Invalid symbol format: {symbol}")
-
-        # Validate parameters section
-        if "parameters" in self.config:
-            params_config = self.config["parameters"]
-            param_fields = [
-                "volume_period", "volume_multiplier", "price_change_threshold",
-                "capital_usage_percent", "add_position_threshold", "stop_loss_threshold",
-                "max_positions", "min_order_size", "max_order_size"
-            ]
-
-            for field in param_fields:
-                if field not in params_config:
-                    errors.append(f"Missing parameter field: {field}")
-
-            # Validate parameter ranges
-            if "volume_period" in params_config:
-                period = params_config["volume_period"]
-                if not isinstance(period, (int, float)) or period <= 0 or period > 200:
-                    errors.append("volume_period must be between 1 and 200")
-
-            if "volume_multiplier" in params_config:
-                multiplier = params_config["volume_multiplier"]
-                if not isinstance(multiplier, (int, float)) or multiplier <= 0 or multiplier > 10:
-                    errors.append("volume_multiplier must be between 0 and 10")
-
-            if "price_change_threshold" in params_config:
-                threshold = params_config["price_change_threshold"]
-                if not isinstance(threshold, (int, float)) or threshold < 0 or threshold > 50:
-                    errors.append("price_change_threshold must be between 0 and 50")
-
-            if "capital_usage_percent" in params_config:
-                usage = params_config["capital_usage_percent"]
-                if not isinstance(usage, (int, float)) or usage <= 0 or usage > 100:
-                    errors.append("capital_usage_percent must be between 0 and 100")
-
-            if "max_positions" in params_config:
-                max_pos = params_config["max_positions"]
-                if not isinstance(max_pos, int) or max_pos <= 0 or max_pos > 20:
-                    errors.append("max_positions must be between 1 and 20")
+        # Check required fields within present sections
+        for section, fields, message in _REQUIRED_FIELDS:
+            if section not in self.config:
+                continue
+            section_config = self.config[section]
+            for field in fields:
+                if field not in section_config:
+                    errors.append(message.format(field))
+
+        # Validate symbol format
+        symbol = self.config.get("trading", {}).get("symbol", _MISSING)
+        if symbol is not _MISSING:
+            if not isinstance(symbol, str) or "/" not in symbol:
+                errors.append(f"Invalid symbol format: {symbol}")
+
+        # Validate parameter ranges
+        params_config = self.config.get("parameters", {})
+        for field, types, lo, lo_exclusive, hi, message in _PARAM_RANGE_RULES:
+            value = params_config.get(field, _MISSING)
+            if value is _MISSING:
+                continue
+            if (not isinstance(value, types)
+                    or (value <= lo if lo_exclusive else value < lo)
+                    or value > hi):
+                errors.append(message)
 
         return errors
 
@@ -225,8 +256,18 @@ class ConfigManager:
             output_file = Path(output_path)
             output_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            # Serialize with orjson when available (same preference as
+            # _parse_config_file); both branches write identical 2-space
+            # indented UTF-8 JSON
+            try:
+                import orjson
+            except ImportError:
+                payload = json.dumps(
+                    self.config, indent=2, ensure_ascii=False
+                ).encode('utf-8')
+            else:
+                payload = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            output_file.write_bytes(payload)
 
             self.logger.info(f"✅ Configuration saved to {output_path}")
 
@@ -237,19 +278,21 @@ class ConfigManager:
     def merge_configs(self, override_config: Dict[str, Any]) -> None:
         """Merge override configuration into current config.
 
+        The merge walks an explicit stack and mutates ``self.config`` in
+        place, so only overridden keys are touched — no per-level dict
+        copies and no recursion.
+
         Args:
             override_config: Configuration to merge.
         """
-        def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-            result = base.copy()
+        stack = [(self.config, override_config)]
+        while stack:
+            base, override = stack.pop()
             for key, value in override.items():
-                if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                    result[key] = deep_merge(result[key], value)
+                if isinstance(value, dict) and isinstance(base.get(key), dict):
+                    stack.append((base[key], value))
                 else:
-                    result[key] = value
-            return result
-
-        self.config = deep_merge(self.config, override_config)
+                    base[key] = value
 
     def get_section(self, section: str, default: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Get configuration section.
@@ -276,20 +319,42 @@ class ConfigManager:
         """
         return self.config.get(section, {}).get(key, default)
 
+    # (monotonic timestamp, result) cache for list_available_configs
+    _CONFIGS_CACHE_TTL = 5.0
+    _configs_cache: tuple = (0.0, [])
+
     def list_available_configs(self) -> List[str]:
         """List available configuration files.
 
+        The scan issues one ``os.scandir`` per unique parent directory
+        instead of stat'ing every candidate path, and the result is
+        cached for a few seconds so repeated calls in a long-running
+        process do not keep hitting the filesystem.
+
         Returns:
             List of configuration file paths.
         """
-        config_files = []
-
-        for path in self.DEFAULT_CONFIG_PATHS:
-            config_path = Path(path)
-            if config_path.exists():
-                config_files.append(str(config_path))
-
-        return config_files
+        now = time.monotonic()
+        stamp, cached = ConfigManager._configs_cache
+        if now - stamp < self._CONFIGS_CACHE_TTL:
+            return list(cached)
+
+        candidates = [Path(path) for path in self.DEFAULT_CONFIG_PATHS]
+        names_by_parent: Dict[Path, set] = {}
+        for parent in {path.parent for path in candidates}:
+            try:
+                with os.scandir(parent) as entries:
+                    names_by_parent[parent] = {entry.name for entry in entries}
+            except OSError:
+                names_by_parent[parent] = set()
+
+        config_files = [
+            str(path) for path in candidates
+            if path.name in names_by_parent[path.parent]
+        ]
+
+        ConfigManager._configs_cache = (now, config_files)
+        return list(config_files)
 
     def __str__(self) -> str:
         """String representation of configuration.
@@ -23,9 +23,106 @@ from src.strategy import (
     ExchangeManager,
     TechnicalIndicators,
     Signal,
+    Kline,
 )
 
 
+# Ring-buffer sizing for the live kline window. Capacity must exceed the
+# logical window so the rolling volume sum never reads a slot that has
+# already been overwritten (window >= volume_period is enforced by the
+# config range checks).
+_BUF_CAPACITY = 256
+_BUF_WINDOW = 200
+_BUF_COLUMNS = ('open', 'high', 'low', 'close', 'volume',
+                'volume_ma', 'volume_ratio', 'price_change_pct')
+
+
+def _compute_indicator_columns(
+    open_: np.ndarray,
+    close: np.ndarray,
+    volume: np.ndarray,
+    period: int,
+) -> tuple:
+    """Compute all three indicator columns from raw ndarrays in one pass.
+
+    Fuses what used to be three separate DataFrame traversals: the
+    volume moving average (Bottleneck's C move_mean when installed,
+    cumulative-sum difference otherwise), the volume ratio, and the
+    open-to-close percentage change all come from a single walk over
+    the input columns.
+
+    Args:
+        open_: Open prices.
+        close: Close prices.
+        volume: Candle volumes.
+        period: Volume moving-average period.
+
+    Returns:
+        Tuple of (volume_ma, volume_ratio, price_change_pct) arrays.
+    """
+    n = len(volume)
+    if n < period:
+        volume_ma = np.full(n, np.nan)
+    else:
+        try:
+            import bottleneck as bn
+        except ImportError:
+            volume_ma = np.full(n, np.nan)
+            csum = np.cumsum(np.insert(volume, 0, 0.0))
+            volume_ma[period - 1:] = (csum[period:] - csum[:-period]) / period
+        else:
+            volume_ma = bn.move_mean(volume, window=period, min_count=period)
+
+    volume_ratio = volume / volume_ma
+    price_change_pct = (close - open_) / open_ * 100.0
+    return volume_ma, volume_ratio, price_change_pct
+
+
+# Fallback configuration used when no config file is found, built once
+# at import time; _get_default_config returns deep copies.
+_DEFAULT_CONFIG = {
+    "strategy": {
+        "name": "Volume Price Breakout Strategy",
+        "version": "1.0"
+    },
+    "trading": {
+        "symbol": "BTC/USDT",
+        "timeframe": "1m",
+        "exchange": "binance",
+        "sandbox": True,
+        "api_key": "",
+        "secret": ""
+    },
+    "parameters": {
+        "volume_period": 30,
+        "volume_multiplier": 2.0,
+        "price_change_threshold": 1.5,
+        "capital_usage_percent": 10,
+        "add_position_threshold": 2.0,
+        "stop_loss_threshold": 3.0,
+        "max_positions": 3,
+        "min_order_size": 0.001,
+        "max_order_size": 1.0
+    },
+    "risk_management": {
+        "max_drawdown": 20,
+        "position_timeout": 3600
+    },
+    "execution": {
+        "slippage": 0.1,
+        "retry_attempts": 3,
+        "retry_delay": 1,
+        "order_timeout": 30
+    },
+    "logging": {
+        "level": "INFO",
+        "log_to_file": True,
+        "log_file": "strategy.log",
+        "print_trades": True
+    }
+}
+
+
 class VolumePriceBreakoutStrategy:
     """Volume Price Breakout Strategy implementation."""
 
@@ -52,6 +149,16 @@ class VolumePriceBreakoutStrategy:
         self.current_price: float = 0.0
         self.klines_data: pd.DataFrame = pd.DataFrame()
 
+        # Live kline window: preallocated ring buffers, seeded by
+        # initialize_data and advanced per candle by _append_candle
+        self._buf: Dict[str, np.ndarray] = {}
+        self._buf_ts: np.ndarray = np.zeros(0, dtype=np.int64)
+        self._head: int = 0
+        self._buf_len: int = 0
+        self._candles_seen: int = 0
+        self._vol_sum: float = 0.0
+        self._last_ts_ms: int = 0
+
         self.logger.info("✅ Volume Price Breakout Strategy initialized")
         self.logger.info(f"📊 Symbol: {self.symbol}, Timeframe: {self.timeframe}")
         self.logger.info(
@@ -71,8 +178,15 @@ class VolumePriceBreakoutStrategy:
         try:
             config_file = Path(config_path)
             if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                # Shared stat-keyed cache: if the CLI already validated
+                # this file, the parsed dict is reused instead of reread.
+                # Deep copy so per-instance config edits cannot leak into
+                # the cache (or into other strategy instances).
+                import copy
+
+                from src.utils.config import load_config_cached
+
+                return copy.deepcopy(load_config_cached(config_file))
             else:
                 self.logger.warning(f"⚠️ Config file {config_path} not found, using defaults")
                 return self._get_default_config()
@@ -84,49 +198,12 @@ class VolumePriceBreakoutStrategy:
         """Get default configuration.
 
         Returns:
-            Default configuration dictionary.
+            Default configuration dictionary (a deep copy of the
+            module-level template).
         """
-        return {
-            "strategy": {
-                "name": "Volume Price Breakout Strategy",
-                "version": "1.0"
-            },
-            "trading": {
-                "symbol": "BTC/USDT",
-                "timeframe": "1m",
-                "exchange": "binance",
-                "sandbox": True,
-                "api_key": "",
-                "secret": ""
-            },
-            "parameters": {
-                "volume_period": 30,
-                "volume_multiplier": 2.0,
-                "price_change_threshold": 1.5,
-                "capital_usage_percent": 10,
-                "add_position_threshold": 2.0,
-                "stop_loss_threshold": 3.0,
-                "max_positions": 3,
-                "min_order_size": 0.001,
-                "max_order_size": 1.0
-            },
-            "risk_management": {
-                "max_drawdown": 20,
-                "position_timeout": 3600
-            },
-            "execution": {
-                "slippage": 0.1,
-                "retry_attempts": 3,
-                "retry_delay": 1,
-                "order_timeout": 30
-            },
-            "logging": {
-                "level": "INFO",
-                "log_to_file": True,
-                "log_file": "strategy.log",
-                "print_trades": True
-            }
-        }
+        import copy
+
+        return copy.deepcopy(_DEFAULT_CONFIG)
 
     def _parse_strategy_parameters(self) -> StrategyParameters:
         """Parse strategy parameters from config.
@@ -134,18 +211,7 @@ class VolumePriceBreakoutStrategy:
         Returns:
             StrategyParameters object.
         """
-        params = self.config.get("parameters", {})
-        return StrategyParameters(
-            volume_period=params.get("volume_period", 30),
-            volume_multiplier=params.get("volume_multiplier", 2.0),
-            price_change_threshold=params.get("price_change_threshold", 1.5),
-            capital_usage_percent=params.get("capital_usage_percent", 10),
-            add_position_threshold=params.get("add_position_threshold", 2.0),
-            stop_loss_threshold=params.get("stop_loss_threshold", 3.0),
-            max_positions=params.get("max_positions", 3),
-            min_order_size=params.get("min_order_size", 0.001),
-            max_order_size=params.get("max_order_size", 1.0)
-        )
+        return StrategyParameters.from_mapping(self.config.get("parameters", {}))
 
     def _setup_logging(self) -> None:
         """Setup logging configuration."""
@@ -194,6 +260,7 @@ class VolumePriceBreakoutStrategy:
             df = self._calculate_indicators(df)
 
             self.klines_data = df
+            self._init_buffers(df)
             self.current_price = float(df['close'].iloc[-1])
 
             self.logger.info(f"✅ Historical data loaded: {len(df)} candles")
@@ -212,20 +279,125 @@ class VolumePriceBreakoutStrategy:
         Returns:
             DataFrame with indicators.
         """
-        # Calculate volume moving average
-        df['volume_ma'] = self.technical_indicators.calculate_volume_ma(
-            df, self.parameters.volume_period
+        # All three columns from one fused pass over the raw arrays
+        volume_ma, volume_ratio, price_change_pct = _compute_indicator_columns(
+            df['open'].to_numpy(np.float64),
+            df['close'].to_numpy(np.float64),
+            df['volume'].to_numpy(np.float64),
+            self.parameters.volume_period,
         )
+        df['volume_ma'] = volume_ma
+        df['volume_ratio'] = volume_ratio
+        df['price_change_pct'] = price_change_pct
+
+        return df
+
+    def _init_buffers(self, df: pd.DataFrame) -> None:
+        """Seed the live ring buffers from the initial history frame.
+
+        Args:
+            df: OHLCV DataFrame with indicators already computed.
+        """
+        n = min(len(df), _BUF_WINDOW)
+        tail = df.iloc[-n:]
+
+        self._buf = {col: np.zeros(_BUF_CAPACITY) for col in _BUF_COLUMNS}
+        self._buf_ts = np.zeros(_BUF_CAPACITY, dtype=np.int64)
+        for col in _BUF_COLUMNS:
+            self._buf[col][:n] = tail[col].to_numpy(np.float64)
+        self._buf_ts[:n] = tail.index.asi8 // 1_000_000
+
+        self._head = n % _BUF_CAPACITY
+        self._buf_len = n
+        self._candles_seen = len(df)
+        self._last_ts_ms = int(self._buf_ts[n - 1]) if n else 0
+
+        period = self.parameters.volume_period
+        volumes = df['volume'].to_numpy(np.float64)
+        self._vol_sum = float(volumes[-min(len(volumes), period):].sum())
+
+    def _append_candle(
+        self,
+        ts_ms: int,
+        open_: float,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> tuple:
+        """Append one candle to the ring and update indicators in O(1).
+
+        The rolling volume sum adds the new bar and drops the one that
+        left the window, so no history is rescanned and nothing is
+        copied — the old path reallocated the whole DataFrame with
+        concat and recomputed every indicator column per candle.
 
-        # Calculate volume ratio
-        df['volume_ratio'] = self.technical_indicators.calculate_volume_ratio(
-            df, df['volume_ma']
+        Args:
+            ts_ms: Candle open time in epoch milliseconds.
+            open_: Open price.
+            high: High price.
+            low: Low price.
+            close: Close price.
+            volume: Candle volume.
+
+        Returns:
+            Tuple of (volume_ma, volume_ratio, price_change_pct) for
+            the new candle.
+        """
+        period = self.parameters.volume_period
+        buf = self._buf
+        head = self._head
+
+        self._vol_sum += volume
+        if self._candles_seen >= period:
+            self._vol_sum -= buf['volume'][(head - period) % _BUF_CAPACITY]
+        self._candles_seen += 1
+
+        if self._candles_seen >= period:
+            volume_ma = self._vol_sum / period
+        else:
+            volume_ma = float('nan')
+        if volume_ma > 0.0:
+            volume_ratio = volume / volume_ma
+        else:
+            volume_ratio = float('nan')
+        price_change_pct = (
+            (close - open_) / open_ * 100.0 if open_ else float('nan')
         )
 
-        # Calculate price change percentage
-        df['price_change_pct'] = self.technical_indicators.calculate_price_change_pct(df)
+        self._buf_ts[head] = int(ts_ms)
+        buf['open'][head] = open_
+        buf['high'][head] = high
+        buf['low'][head] = low
+        buf['close'][head] = close
+        buf['volume'][head] = volume
+        buf['volume_ma'][head] = volume_ma
+        buf['volume_ratio'][head] = volume_ratio
+        buf['price_change_pct'][head] = price_change_pct
 
-        return df
+        self._head = (head + 1) % _BUF_CAPACITY
+        if self._buf_len < _BUF_WINDOW:
+            self._buf_len += 1
+        self._last_ts_ms = int(ts_ms)
+
+        return volume_ma, volume_ratio, price_change_pct
+
+    def _window_frame(self) -> pd.DataFrame:
+        """Materialize the current ring window as an ordered DataFrame.
+
+        Only for callers that genuinely need a frame (reporting,
+        debugging); the live loop works on the buffers directly.
+
+        Returns:
+            DataFrame of the last ``_buf_len`` candles, oldest first.
+        """
+        order = np.arange(self._head - self._buf_len, self._head) % _BUF_CAPACITY
+        frame = pd.DataFrame(
+            {col: self._buf[col][order] for col in _BUF_COLUMNS},
+            index=pd.to_datetime(self._buf_ts[order], unit='ms'),
+        )
+        frame.index.name = 'timestamp'
+        return frame
 
     def check_entry_signal(self, kline_data: Dict) -> Optional[Signal]:
         """Check for entry signal.
@@ -268,50 +440,51 @@ class VolumePriceBreakoutStrategy:
         try:
             while self.running:
                 try:
-                    # Get current ticker data
-                    ticker = await self.exchange_manager.exchange.fetch_ticker(self.symbol)
-                    self.current_price = float(ticker['last'])
-
-                    # Update klines data periodically
-                    if len(self.klines_data) > 0:
-                        # Get latest candle
-                        latest_ohlcv = await self.exchange_manager.exchange.fetch_ohlcv(
-                            self.symbol, self.timeframe, limit=1
-                        )
-
-                        if latest_ohlcv:
-                            latest_data = latest_ohlcv[0]
-                            latest_timestamp = pd.to_datetime(latest_data[0], unit='ms')
-
-                            # Update if new candle
-                            if latest_timestamp > self.klines_data.index[-1]:
-                                new_candle = pd.DataFrame(
-                                    [[latest_data[0], latest_data[1], latest_data[2],
-                                      latest_data[3], latest_data[4], latest_data[5]]],
-                                    columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
-                                )
-                                new_candle['timestamp'] = pd.to_datetime(new_candle['timestamp'], unit='ms')
-                                new_candle.set_index('timestamp', inplace=True)
-
-                                # Recalculate indicators for new candle
-                                self.klines_data = pd.concat([self.klines_data, new_candle])
-                                self.klines_data = self._calculate_indicators(self.klines_data)
-
-                                # Keep only last 200 candles
-                                if len(self.klines_data) > 200:
-                                    self.klines_data = self.klines_data.tail(200)
-
-                                # Check entry signal
-                                latest_candle = self.klines_data.iloc[-1].to_dict()
-                                latest_candle['symbol'] = self.symbol
-                                latest_candle['timestamp'] = latest_timestamp
-
-                                signal = self.check_entry_signal(latest_candle)
-                                if signal:
-                                    await self.execute_entry(signal)
+                    # One REST call per tick: a since-filtered OHLCV fetch
+                    # both advances the kline window and carries the latest
+                    # price, replacing the fetch_ticker + limit=1 pair.
+                    # since is inclusive of the last seen candle so its
+                    # still-forming close keeps updating current_price.
+                    ohlcv = await self.exchange_manager.exchange.fetch_ohlcv(
+                        self.symbol, self.timeframe, since=self._last_ts_ms or None
+                    )
+
+                    if ohlcv:
+                        self.current_price = float(ohlcv[-1][4])
+
+                    if self._buf_len:
+                        # Append only genuinely new candles; the ring
+                        # buffers and the O(1) indicator update replace
+                        # the old concat + full recompute + tail(200)
+                        for candle in ohlcv:
+                            ts_ms, open_, high, low, close, volume = candle
+                            if ts_ms <= self._last_ts_ms:
+                                continue
+                            volume_ma, volume_ratio, price_change_pct = (
+                                self._append_candle(ts_ms, open_, high, low, close, volume)
+                            )
+
+                            # Check entry signal; the Kline tuple goes
+                            # straight from raw OHLCV values to the
+                            # detector without building a dict
+                            latest_candle = Kline(
+                                symbol=self.symbol,
+                                timestamp=pd.to_datetime(ts_ms, unit='ms'),
+                                open=open_,
+                                high=high,
+                                low=low,
+                                close=close,
+                                volume=volume,
+                                volume_ma=volume_ma,
+                                volume_ratio=volume_ratio,
+                                price_change_pct=price_change_pct,
+                            )
+                            signal = self.check_entry_signal(latest_candle)
+                            if signal:
+                                await self.execute_entry(signal)
 
                     # Update positions
-                    if self.position_manager.positions:
+                    if self.position_manager.position_count:
                         account_balance = 10000.0  # Placeholder
                         self.position_manager.update_positions(
                             self.current_price,
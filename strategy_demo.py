@@ -6,12 +6,25 @@
 import json
 import time
 import random
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 import pandas as pd
 import numpy as np
 
 
+@dataclass(slots=True)
+class Position:
+    """单笔持仓记录（slots布局：C级属性访问，内存约为dict的1/3）"""
+    symbol: str
+    entry_price: float
+    quantity: float
+    entry_time: object
+    highest_price: float
+    stop_loss_price: float
+    total_invested: float
+
+
 class StrategyDemo:
     """策略演示类"""
 
@@ -29,7 +42,7 @@ class StrategyDemo:
 
         # 模拟数据
         self.current_price = 103000.0
-        self.positions: List[Dict] = []
+        self.positions: List[Position] = []
         self.klines_data = self._generate_mock_klines()
 
     def _load_config(self, config_path: str) -> Dict:
@@ -149,15 +162,15 @@ class StrategyDemo:
 
         position_size = self.calculate_position_size()
 
-        position = {
-            'symbol': self.config["trading"]["symbol"],
-            'entry_price': signal['price'],
-            'quantity': position_size,
-            'entry_time': signal['timestamp'],
-            'highest_price': signal['price'],
-            'stop_loss_price': signal['price'] * (1 - self.S / 100),
-            'total_invested': signal['price'] * position_size
-        }
+        position = Position(
+            symbol=self.config["trading"]["symbol"],
+            entry_price=signal['price'],
+            quantity=position_size,
+            entry_time=signal['timestamp'],
+            highest_price=signal['price'],
+            stop_loss_price=signal['price'] * (1 - self.S / 100),
+            total_invested=signal['price'] * position_size,
+        )
 
         self.positions.append(position)
 
@@ -168,25 +181,28 @@ class StrategyDemo:
         print(f"   价格变化: {signal['price_change_pct']:+.2f}%")
         print(f"   当前持仓数: {len(self.positions)}")
 
-    def check_add_position_signal(self, position: Dict, current_price: float) -> bool:
+    def check_add_position_signal(self, position: Position, current_price: float) -> bool:
         """检查加仓信号"""
-        price_increase_pct = ((current_price - position['entry_price']) /
-                             position['entry_price'] * 100)
+        price_increase_pct = ((current_price - position.entry_price) /
+                             position.entry_price * 100)
         return price_increase_pct >= self.U
 
-    def check_exit_signal(self, position: Dict, current_price: float) -> bool:
+    def check_exit_signal(self, position: Position, current_price: float) -> bool:
         """检查出场信号"""
-        drawdown_pct = ((position['highest_price'] - current_price) /
-                       position['highest_price'] * 100)
+        drawdown_pct = ((position.highest_price - current_price) /
+                       position.highest_price * 100)
         return drawdown_pct >= self.S
 
     def update_positions(self, current_price: float):
         """更新持仓状态"""
-        for position in self.positions:
+        # 倒序按索引遍历，出场用swap-pop原地删除（O(1)，且不会跳过元素）
+        for i in range(len(self.positions) - 1, -1, -1):
+            position = self.positions[i]
+
             # 更新最高价
-            if current_price > position['highest_price']:
-                position['highest_price'] = current_price
-                position['stop_loss_price'] = position['highest_price'] * (1 - self.S / 100)
+            if current_price > position.highest_price:
+                position.highest_price = current_price
+                position.stop_loss_price = position.highest_price * (1 - self.S / 100)
 
             # 检查加仓信号
             if self.check_add_position_signal(position, current_price):
@@ -195,8 +211,10 @@ class StrategyDemo:
             # 检查出场信号
             if self.check_exit_signal(position, current_price):
                 self.execute_exit(position)
+                self.positions[i] = self.positions[-1]
+                self.positions.pop()
 
-    def execute_add_position(self, position: Dict):
+    def execute_add_position(self, position: Position):
         """执行加仓"""
         if len(self.positions) >= self.config["risk_management"]["max_positions"]:
             return
@@ -205,32 +223,31 @@ class StrategyDemo:
         additional_cost = self.current_price * additional_size
 
         # 更新持仓信息
-        total_quantity = position['quantity'] + additional_size
-        total_cost = position['total_invested'] + additional_cost
+        total_quantity = position.quantity + additional_size
+        total_cost = position.total_invested + additional_cost
 
-        position['quantity'] = total_quantity
-        position['entry_price'] = total_cost / total_quantity
-        position['total_invested'] = total_cost
+        position.quantity = total_quantity
+        position.entry_price = total_cost / total_quantity
+        position.total_invested = total_cost
 
         print(f"📈 加仓信号执行成功!")
         print(f"   加仓价格: ${self.current_price:,.2f}")
         print(f"   加仓数量: {additional_size:.6f}")
-        print(f"   新持仓均价: ${position['entry_price']:,.2f}")
-        print(f"   总数量: {position['quantity']:.6f}")
+        print(f"   新持仓均价: ${position.entry_price:,.2f}")
+        print(f"   总数量: {position.quantity:.6f}")
 
-    def execute_exit(self, position: Dict):
+    def execute_exit(self, position: Position):
         """执行出场"""
         exit_price = self.current_price
-        pnl = (exit_price - position['entry_price']) * position['quantity']
-        pnl_pct = ((exit_price - position['entry_price']) / position['entry_price'] * 100)
+        pnl = (exit_price - position.entry_price) * position.quantity
+        pnl_pct = ((exit_price - position.entry_price) / position.entry_price * 100)
 
         print(f"🔴 出场信号执行成功!")
         print(f"   出场价格: ${exit_price:,.2f}")
-        print(f"   入场价格: ${position['entry_price']:,.2f}")
-        print(f"   数量: {position['quantity']:.6f}")
+        print(f"   入场价格: ${position.entry_price:,.2f}")
+        print(f"   数量: {position.quantity:.6f}")
         print(f"   盈亏: ${pnl:+.2f} ({pnl_pct:+.2f}%)")
-
-        self.positions.remove(position)
+        # 持仓的移除由调用方（update_positions）统一负责
 
     def print_status(self):
         """打印当前状态"""
@@ -247,18 +264,18 @@ class StrategyDemo:
 
             print(f"\n📈 持仓详情:")
             for i, pos in enumerate(self.positions, 1):
-                current_pnl = (self.current_price - pos['entry_price']) * pos['quantity']
-                pnl_pct = ((self.current_price - pos['entry_price']) / pos['entry_price'] * 100)
+                current_pnl = (self.current_price - pos.entry_price) * pos.quantity
+                pnl_pct = ((self.current_price - pos.entry_price) / pos.entry_price * 100)
 
                 total_pnl += current_pnl
-                total_invested += pos['total_invested']
+                total_invested += pos.total_invested
 
                 print(f"  持仓 {i}:")
-                print(f"    入场价: ${pos['entry_price']:,.2f}")
+                print(f"    入场价: ${pos.entry_price:,.2f}")
                 print(f"    当前价: ${self.current_price:,.2f}")
-                print(f"    数量: {pos['quantity']:.6f}")
-                print(f"    最高价: ${pos['highest_price']:,.2f}")
-                print(f"    止损价: ${pos['stop_loss_price']:,.2f}")
+                print(f"    数量: {pos.quantity:.6f}")
+                print(f"    最高价: ${pos.highest_price:,.2f}")
+                print(f"    止损价: ${pos.stop_loss_price:,.2f}")
                 print(f"    盈亏: ${current_pnl:+.2f} ({pnl_pct:+.2f}%)")
 
             total_pnl_pct = (total_pnl / total_invested * 100) if total_invested > 0 else 0
@@ -37,14 +37,15 @@ async def test_strategy_initialization():
 
         # 显示最新几根K线的数据
         print("\n📊 最新K线数据:")
+        # itertuples避免iterrows逐行装箱成object dtype的Series
         latest_klines = runner.strategy.klines_data.tail(3)
-        for i, (timestamp, row) in enumerate(latest_klines.iterrows()):
+        for i, row in enumerate(latest_klines.itertuples(index=True)):
             print(f"  K线 {i+1}:")
-            print(f"    时间: {timestamp}")
-            print(f"    收盘: ${row['close']:,.2f}")
-            print(f"    成交量: {row['volume']:,.0f}")
-            print(f"    成交量比: {row['volume_ratio']:.2f}")
-            print(f"    价格变化: {row['price_change_pct']:+.2f}%")
+            print(f"    时间: {row.Index}")
+            print(f"    收盘: ${row.close:,.2f}")
+            print(f"    成交量: {row.volume:,.0f}")
+            print(f"    成交量比: {row.volume_ratio:.2f}")
+            print(f"    价格变化: {row.price_change_pct:+.2f}%")
 
     except Exception as e:
         print(f"❌ 数据获取失败: {e}")
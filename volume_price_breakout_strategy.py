@@ -369,8 +369,8 @@ class VolumePriceBreakoutStrategy:
             self.logger.info(f"加仓成功: {self.symbol} @ ${order.price:.2f}, 数量: {order.quantity:.6f}")
             self.logger.info(f"新持仓均价: ${position.entry_price:.2f}, 总数量: {position.quantity:.6f}")
 
-    async def execute_exit(self, position: Position):
-        """执行出场"""
+    async def execute_exit(self, position: Position) -> bool:
+        """执行出场，成交返回True（由调用方负责从持仓列表移除）"""
         order = await self.place_order(OrderSide.SELL, position.quantity)
 
         if order and order.status == OrderStatus.FILLED:
@@ -380,13 +380,15 @@ class VolumePriceBreakoutStrategy:
 
             self.logger.info(f"出场成功: {self.symbol} @ ${order.price:.2f}")
             self.logger.info(f"盈亏: ${pnl:.2f} ({pnl_pct:+.2f}%)")
+            return True
 
-            self.positions.remove(position)
-            self.logger.info(f"剩余持仓数量: {len(self.positions)}")
+        return False
 
     async def update_positions(self):
         """更新持仓状态"""
-        for position in self.positions:
+        exit_indices = set()
+
+        for i, position in enumerate(self.positions):
             # 更新最高价
             if self.current_price > position.highest_price:
                 position.highest_price = self.current_price
@@ -403,7 +405,13 @@ class VolumePriceBreakoutStrategy:
             # 检查出场信号
             if self.check_exit_signal(position):
                 self.logger.info(f"触发出场信号: {self.symbol} @ ${self.current_price:.2f}")
-                await self.execute_exit(position)
+                if await self.execute_exit(position):
+                    exit_indices.add(i)
+
+        # 按索引一次性重建列表，避免遍历中O(n)的list.remove
+        if exit_indices:
+            self.positions = [p for i, p in enumerate(self.positions) if i not in exit_indices]
+            self.logger.info(f"剩余持仓数量: {len(self.positions)}")
 
     async def watch_realtime_data(self):
         """监控实时数据"""